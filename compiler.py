@@ -1,3 +1,4 @@
+import random
 from typing import List, Union, Dict, Tuple
 
 from numpy import product
@@ -7,6 +8,7 @@ from numpy import product
 ↓ 2. Declare TM I/O variables and compilation options (skip step 5&6?)
 ↓ 3. Program atomization
 [Sample testing possible]
+[Static cost estimate (cost_model.py)]
 ↓ 4. Compute access graph (def-use/use-def chains)
 ↓ 5. Constant folding & propagation, dead store & code elimination (+ loop & conditional optimization)
 [Sample testing]
@@ -17,7 +19,6 @@ from numpy import product
 
 TODO:
 
-- randomized tests
 - optimize commutative ops during constant folding (convert to aggregate ops first)
     a <= (a+1)+2
     a <= (a*2)*3
@@ -85,6 +86,68 @@ class RecursiveAtomizer:
 
         return instructions, target_variable
 
+class RandomProgramGenerator:
+    """ Generates random well-formed programs over the input variables v0, v1, ..
+
+    Every loop runs on its own counter (i0, i1, ..) that is only ever decremented, so all programs terminate. Divisors
+    are of the form e*e+1 and products inside loops always have a constant factor, which keeps values from growing
+    exponentially with the number of loop iterations.
+    """
+
+    def __init__(self, rng: random.Random, n_variables: int, max_expression_depth: int, max_loop_iterations: int):
+        self.rng = rng
+        self.variables = [Var(f'v{i}') for i in range(n_variables)]
+        self.max_expression_depth = max_expression_depth
+        self.max_loop_iterations = max_loop_iterations
+        self.count = 0
+
+    def expression(self, depth: int, in_loop: bool) -> Union['Value', int]:
+        if depth <= 0 or self.rng.random() < 0.3:
+            return self.rng.choice(self.variables) if self.rng.random() < 0.7 else self.rng.randint(0, 9)
+
+        op = self.rng.choice([Add, Sub, Mult, Div, And, Or, Less, Equals, Greater, Not, Negate])
+        if issubclass(op, UnaryOp):
+            return op(self.expression(depth-1, in_loop))
+        elif op is Mult and in_loop:
+            return Mult(self.expression(depth-1, in_loop), self.rng.randint(0, 9))
+        elif op is Div:
+            divisor = self.expression(depth-1, in_loop)
+            return Div(self.expression(depth-1, in_loop), Add(Mult(divisor, divisor), 1))
+        return op(self.expression(depth-1, in_loop), self.expression(depth-1, in_loop))
+
+    def condition(self, in_loop: bool) -> Union['Value', int]:
+        return self.rng.choice([Less, Equals, Greater])(self.expression(self.max_expression_depth-1, in_loop),
+                                                         self.expression(self.max_expression_depth-1, in_loop))
+
+    def run(self, size: int, depth: int, in_loop: bool = False) -> 'Program':
+        instructions = []
+        while size > 0:
+            kind = self.rng.choice(['assign'] * 3 + (['if', 'while'] if depth > 0 and size > 1 else []))
+            if kind == 'assign':
+                instructions.append(Assign(self.rng.choice(self.variables),
+                                           self.expression(self.max_expression_depth, in_loop)))
+                size -= 1
+            elif kind == 'if':
+                body_size = self.rng.randint(1, size-1)
+                else_size = self.rng.randint(0, body_size)
+                instructions.append(If(self.condition(in_loop), self.run(body_size-else_size, depth-1, in_loop),
+                                       self.run(else_size, depth-1, in_loop)))
+                size -= body_size + 1
+            else:
+                counter = Var(f'i{self.count}')
+                self.count += 1
+                body_size = self.rng.randint(1, size-1)
+                body = self.run(body_size, depth-1, True)
+                if self.rng.random() < 0.5:
+                    condition = counter > 0
+                else:
+                    # exits early depending on the program state, the counter still bounds the iterations
+                    condition = (counter > 0) & self.condition(True)
+                instructions.append(Write(counter, self.rng.randint(0, self.max_loop_iterations)))
+                instructions.append(While(condition, Program(body.p + [counter <= counter - 1])))
+                size -= body_size + 1
+        return Program(instructions)
+
 class ContainsVariables(object):
     @property
     def variables(self):
@@ -442,8 +505,14 @@ class Program(ContainsVariables):
         return variable_assignments  # return all variables, not just the output ones, required for Ifs, While's
 
     @staticmethod
-    def create_random():
-        pass
+    def create_random(size: int = 10, max_depth: int = 2, n_variables: int = 3, max_expression_depth: int = 2,
+                      max_loop_iterations: int = 3, seed=None) -> 'Program':
+        """ Random terminating program with about `size` instructions (excluding loop counters) and at most
+        `max_depth` levels of nested If/While blocks. Reads the inputs v0, .., v{n_variables-1}, which have to be
+        assigned by the caller (see fuzz.py).
+        """
+        generator = RandomProgramGenerator(random.Random(seed), n_variables, max_expression_depth, max_loop_iterations)
+        return generator.run(size, max_depth)
 
     @property
     def as_atomized(self):
@@ -0,0 +1,140 @@
+import os
+import random
+from typing import List, Dict, Union
+
+from compiler import (Var, Program, If, While, Instruction, Value, UnaryOp, BinaryOp, AggregateOp, Assign, Copy,
+                      Write)
+
+""" Regression and benchmark corpus: the hand written test programs and a fixed set of random programs, each with the
+input assignments it is run on (see fuzz.py).
+
+The random programs, all inputs, the expected Program.execute results and the programs known to diverge because of
+atomizer bugs are stored in corpus_data.py, so that changes to Program.create_random don't replace the corpus. It is
+written by `python fuzz.py --regenerate-corpus`.
+"""
+
+a = Var('a')
+b = Var('b')
+c = Var('c')
+x = Var('x')
+y = Var('y')
+z = Var('z')
+
+mult = Program([
+    z <= 0,
+    While(x > 0, Program([
+        z <= z+y,
+        x <= x-1
+    ]))
+])
+
+fac = Program([
+    y <= 1,
+    While(x > 0, Program([
+        y <= y*x,
+        x <= x-1
+    ]))
+])
+
+prime_checker = Program([
+    z <= 1,
+    c <= 2,
+    While(c < x, Program([
+        b <= x // c,
+        If((b*c) == x, Program([
+            z <= 0
+        ]), Program([])),
+
+        c <= c+1
+    ]))
+])
+
+
+def random_inputs(rng: random.Random, n_variables: int, n: int, lo: int = -8, hi: int = 15):
+    return [{Var(f'v{i}'): rng.randint(lo, hi) for i in range(n_variables)} for _ in range(n)]
+
+
+def source(v: Union[Program, Instruction, Value, int], level: int = 0) -> str:
+    """ Python source that constructs v, variables are referenced by name """
+    if type(v) is int:
+        return repr(v)
+    elif type(v) is Var:
+        return v.name
+    elif issubclass(type(v), UnaryOp):
+        return f'{type(v).__name__}({source(v.a)})'
+    elif issubclass(type(v), BinaryOp):
+        return f'{type(v).__name__}({source(v.a)}, {source(v.b)})'
+    elif issubclass(type(v), AggregateOp):
+        return f'{type(v).__name__}([{", ".join(source(k) for k in v.a)}])'
+    elif type(v) is Assign:
+        return f'Assign({source(v.variable)}, {source(v.value)})'
+    elif type(v) in (Write, Copy):
+        return f'{type(v).__name__}({source(v.a)}, {source(v.b)})'
+    elif type(v) is If:
+        return f'If({source(v.condition)}, {source(v.body_if, level)}, {source(v.body_else, level)})'
+    elif type(v) is While:
+        return f'While({source(v.condition)}, {source(v.body, level)})'
+    elif type(v) is Program:
+        if not v.p:
+            return 'Program([])'
+        body = ''.join(f'{"    " * (level+1)}{source(k, level+1)},\n' for k in v.p)
+        return f'Program([\n{body}{"    " * level}])'
+    else:
+        raise NotImplementedError()
+
+
+def write_corpus(path: str, programs: Dict[str, Program], inputs: Dict[str, List[Dict[Var, int]]],
+                 expected_results: Dict[str, List[Union[Dict[str, int], str]]], expected_failures: List[str],
+                 hash_seed: int):
+    variables = sorted({v.name for p in programs.values() for v in p.variables})
+    lines = [
+        '# generated by `python fuzz.py --regenerate-corpus`, do not edit',
+        'from compiler import Var, Program, Assign, Copy, Write, If, While, Add, Sub, Mult, Div, And, Or, Less, '
+        'Equals, Greater, Not, Negate, Sum, Product',
+        '',
+        f'hash_seed = {hash_seed}  # PYTHONHASHSEED the expected failures were recorded with',
+        '',
+    ]
+    lines += [f'{k} = Var({k!r})' for k in variables]
+    lines += ['', 'random_programs = {']
+    lines += [f'    {name!r}: {source(p, 1)},' for name, p in programs.items()]
+    lines += ['}', '', 'inputs = {']
+    lines += [f'    {name!r}: {[{v.name: k for v, k in a.items()} for a in i]!r},' for name, i in inputs.items()]
+    lines += ['}', '', 'expected_results = {']
+    lines += [f'    {name!r}: {r!r},' for name, r in expected_results.items()]
+    lines += ['}', '', '# diverging between the backends because of atomizer bugs']
+    lines += [f'expected_failures = {sorted(expected_failures)!r}', '']
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+def random_corpus_programs() -> Dict[str, Program]:
+    """ the random part of the corpus, as generated by the current Program.create_random """
+    return {f'random{seed}': Program.create_random(size=15, max_depth=3, seed=seed) for seed in range(50)}
+
+
+def random_corpus_inputs() -> Dict[str, List[Dict[Var, int]]]:
+    return {f'random{seed}': random_inputs(random.Random(seed), n_variables=3, n=8) for seed in range(50)}
+
+
+hand_written = {
+    'mult': (mult, [{x: i, y: j} for i in range(8) for j in range(8)]),
+    'fac': (fac, [{x: i} for i in range(16)]),
+    'prime_checker': (prime_checker, [{x: i} for i in range(2, 64)]),
+}
+
+corpus_data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus_data.py')
+
+try:
+    import corpus_data
+except ImportError:
+    corpus_data = None
+
+# name -> (program, inputs, expected Program.execute results or None if not recorded yet)
+corpus = {name: (p, i, corpus_data.expected_results.get(name) if corpus_data else None)
+          for name, (p, i) in hand_written.items()}
+if corpus_data:
+    for name, p in corpus_data.random_programs.items():
+        corpus[name] = (p, [{Var(v): k for v, k in a.items()} for a in corpus_data.inputs[name]],
+                        corpus_data.expected_results.get(name))
+expected_failures = set(corpus_data.expected_failures) if corpus_data else set()
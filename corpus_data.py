@@ -0,0 +1,1426 @@
+# generated by `python fuzz.py --regenerate-corpus`, do not edit
+from compiler import Var, Program, Assign, Copy, Write, If, While, Add, Sub, Mult, Div, And, Or, Less, Equals, Greater, Not, Negate, Sum, Product
+
+hash_seed = 0  # PYTHONHASHSEED the expected failures were recorded with
+
+i0 = Var('i0')
+i1 = Var('i1')
+i2 = Var('i2')
+i3 = Var('i3')
+i4 = Var('i4')
+i5 = Var('i5')
+v0 = Var('v0')
+v1 = Var('v1')
+v2 = Var('v2')
+
+random_programs = {
+    'random0': Program([
+        If(Less(v1, And(5, v0)), Program([
+            Write(i0, 0),
+            While(Greater(i0, 0), Program([
+                Assign(v0, Not(Greater(9, 4))),
+                Assign(v2, 5),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v1, Negate(Greater(v2, v2))),
+            Assign(v0, Less(Negate(v2), Or(v1, 1))),
+            Assign(v2, 2),
+            Assign(v1, 8),
+        ]), Program([
+            If(Greater(v1, Greater(v2, v1)), Program([]), Program([
+                Assign(v0, Less(Div(0, Add(Mult(v0, v0), 1)), Negate(v0))),
+            ])),
+            Assign(v2, Mult(Sub(8, v2), Greater(3, 9))),
+            If(Equals(Or(v2, v2), Div(v2, Add(Mult(v2, v2), 1))), Program([
+                Assign(v1, Or(Add(v0, 3), v2)),
+            ]), Program([
+                Assign(v2, v0),
+            ])),
+        ])),
+        Assign(v2, v0),
+    ]),
+    'random1': Program([
+        Assign(v2, Sub(v1, Less(1, v1))),
+        If(Greater(Div(0, Add(Mult(v0, v0), 1)), v0), Program([
+            If(Greater(v1, Greater(v0, v1)), Program([
+                Assign(v0, Greater(Sub(v2, 1), Greater(6, v2))),
+            ]), Program([
+                Assign(v1, 7),
+                Write(i0, 1),
+                While(And(Greater(i0, 0), Greater(Or(v0, v1), Not(v1))), Program([
+                    Assign(v0, Less(Mult(v2, 5), v0)),
+                    Assign(i0, Sub(i0, 1)),
+                ])),
+            ])),
+            Assign(v2, v0),
+            Write(i1, 2),
+            While(And(Greater(i1, 0), Equals(1, v0)), Program([
+                Assign(v1, Not(And(v2, 0))),
+                If(Equals(Equals(9, v2), Or(v0, v2)), Program([
+                    Assign(v1, Add(Negate(v2), v2)),
+                ]), Program([])),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+        ]), Program([])),
+        Assign(v1, v1),
+        Assign(v0, v0),
+        Assign(v1, And(Or(v0, v1), Div(8, Add(Mult(v1, v1), 1)))),
+    ]),
+    'random2': Program([
+        Assign(v0, 4),
+        Assign(v2, v2),
+        Assign(v1, Greater(Greater(8, v0), Or(v1, 6))),
+        Write(i0, 3),
+        While(Greater(i0, 0), Program([
+            Write(i1, 2),
+            While(And(Greater(i1, 0), Equals(Negate(v1), Greater(5, 5))), Program([
+                Assign(v0, v0),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v0, Less(Equals(v0, v1), Or(v1, 7))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Equals(Mult(9, v1), Greater(v2, v2)), Program([
+            If(Equals(Negate(v0), Or(3, 1)), Program([
+                Assign(v2, And(Negate(1), Mult(3, 0))),
+                Assign(v2, Add(Mult(v0, v0), 0)),
+            ]), Program([
+                Assign(v1, 2),
+            ])),
+            Assign(v2, v0),
+        ]), Program([
+            Assign(v0, 1),
+        ])),
+        Assign(v1, And(Not(4), Not(7))),
+    ]),
+    'random3': Program([
+        Assign(v2, Or(Equals(v0, v1), v2)),
+        If(Equals(Mult(v0, 8), Add(v0, v2)), Program([
+            Assign(v1, And(Less(6, v2), Mult(1, v1))),
+        ]), Program([
+            Assign(v1, Less(And(v1, v2), Not(v1))),
+            Assign(v1, Negate(Or(9, v2))),
+            Assign(v2, Not(v1)),
+            If(Less(Mult(v1, 1), v0), Program([]), Program([
+                Assign(v2, Greater(And(v0, v0), v0)),
+            ])),
+            If(Equals(v1, Mult(6, v2)), Program([]), Program([
+                If(Equals(Div(8, Add(Mult(6, 6), 1)), Or(v1, 5)), Program([]), Program([
+                    Assign(v1, Negate(v1)),
+                ])),
+            ])),
+        ])),
+        If(Equals(And(0, v2), v2), Program([]), Program([
+            If(Less(Or(9, v1), 9), Program([]), Program([
+                Assign(v2, v2),
+            ])),
+        ])),
+        Assign(v0, Negate(Sub(v1, 3))),
+    ]),
+    'random4': Program([
+        Assign(v1, v0),
+        Assign(v0, v1),
+        Assign(v0, Or(v0, 0)),
+        Assign(v1, v2),
+        Assign(v0, Or(Greater(v0, v0), Greater(0, 9))),
+        Assign(v2, v1),
+        If(Less(Add(v1, v1), Negate(v1)), Program([
+            Assign(v2, v0),
+            If(Equals(Not(v2), v0), Program([
+                Assign(v1, Not(Sub(v0, v0))),
+                Assign(v1, And(Or(v1, v0), Less(9, v0))),
+            ]), Program([
+                Assign(v2, v0),
+            ])),
+            Assign(v1, Mult(Add(v1, v1), Not(v0))),
+        ]), Program([
+            If(Less(9, Mult(v2, v0)), Program([
+                Assign(v0, v1),
+            ]), Program([])),
+        ])),
+    ]),
+    'random5': Program([
+        Write(i0, 0),
+        While(And(Greater(i0, 0), Equals(v0, And(v1, 9))), Program([
+            Assign(v2, Negate(Add(3, v0))),
+            Assign(v1, Div(6, Add(Mult(Sub(v0, 6), Sub(v0, 6)), 1))),
+            Assign(v0, v0),
+            Assign(v0, Add(v0, And(v0, v2))),
+            Assign(v0, 3),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Write(i1, 1),
+        While(And(Greater(i1, 0), Equals(Mult(v2, 0), Or(2, 9))), Program([
+            Assign(v1, And(Or(v1, 0), 5)),
+            If(Equals(Add(v2, v0), v1), Program([]), Program([
+                Assign(v2, Greater(v2, Or(0, v0))),
+            ])),
+            Assign(v1, Or(Or(v2, v1), And(v0, v2))),
+            Assign(v1, v2),
+            Assign(v1, 5),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+        If(Equals(Add(4, v2), Greater(v1, v1)), Program([
+            Assign(v1, v0),
+        ]), Program([])),
+    ]),
+    'random6': Program([
+        Write(i0, 3),
+        While(And(Greater(i0, 0), Equals(Equals(0, 2), Not(v2))), Program([
+            Assign(v1, Add(v1, Or(v0, v0))),
+            If(Greater(v2, And(v2, v1)), Program([
+                Assign(v0, Less(Equals(v0, 4), v0)),
+            ]), Program([
+                Assign(v1, Div(Add(v0, v1), Add(Mult(Negate(8), Negate(8)), 1))),
+                Assign(v2, v2),
+                Write(i1, 3),
+                While(Greater(i1, 0), Program([
+                    Assign(v2, And(Less(v0, v2), Div(v2, Add(Mult(0, 0), 1)))),
+                    Assign(v2, Or(Less(v2, 0), v1)),
+                    Assign(i1, Sub(i1, 1)),
+                ])),
+                Assign(v0, Negate(Equals(v1, 8))),
+                If(Greater(Sub(v2, v1), Mult(v2, 1)), Program([]), Program([
+                    Assign(v2, Div(v1, Add(Mult(v2, v2), 1))),
+                ])),
+            ])),
+            Write(i2, 0),
+            While(And(Greater(i2, 0), Less(And(v2, v0), v2)), Program([
+                Assign(v2, Equals(Less(v2, 5), Mult(9, 6))),
+                Assign(v2, v1),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+    ]),
+    'random7': Program([
+        Assign(v0, Add(v1, Greater(v0, v0))),
+        Assign(v0, Add(Sub(9, 9), Add(0, v0))),
+        Assign(v1, v1),
+        Write(i0, 3),
+        While(And(Greater(i0, 0), Greater(Mult(v2, 9), Add(v2, 6))), Program([
+            Assign(v0, Negate(v2)),
+            Assign(v2, v2),
+            Write(i1, 3),
+            While(Greater(i1, 0), Program([
+                Assign(v1, Equals(Div(v1, Add(Mult(3, 3), 1)), Or(4, v0))),
+                Assign(v2, Or(v0, Sub(9, 5))),
+                Assign(v2, Equals(Equals(v0, 7), Sub(v2, v2))),
+                If(Equals(Or(v1, v2), v1), Program([]), Program([
+                    Assign(v2, v1),
+                    Assign(v0, Greater(v1, And(5, v1))),
+                ])),
+                Assign(v0, v2),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v0, v1),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+    ]),
+    'random8': Program([
+        Assign(v1, Mult(v0, 3)),
+        If(Equals(Less(v0, 6), v0), Program([
+            Assign(v2, Less(Negate(v0), Less(v0, v2))),
+            Assign(v1, Greater(Not(9), 7)),
+            Assign(v0, Not(Not(4))),
+            Write(i0, 3),
+            While(Greater(i0, 0), Program([
+                If(Greater(v2, Negate(8)), Program([
+                    Assign(v0, Or(Greater(v2, 8), v0)),
+                ]), Program([])),
+                Assign(v1, v1),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v2, Mult(Add(v0, v0), Less(v0, v0))),
+            Assign(v1, Less(Not(v2), v0)),
+            Write(i1, 2),
+            While(Greater(i1, 0), Program([
+                Assign(v2, Mult(Sub(v0, v2), 9)),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+        ]), Program([])),
+        Assign(v1, Add(Equals(v2, v2), v1)),
+        Assign(v0, v1),
+    ]),
+    'random9': Program([
+        If(Equals(0, Equals(1, v2)), Program([
+            Assign(v2, Equals(Less(v0, v0), Not(v2))),
+            If(Equals(v1, And(6, v0)), Program([
+                Assign(v2, Less(v1, v2)),
+                Assign(v2, 3),
+                Assign(v1, v2),
+            ]), Program([])),
+        ]), Program([
+            Assign(v2, v0),
+            If(Less(Sub(2, v2), Add(v2, v0)), Program([]), Program([
+                Assign(v1, Not(Sub(6, 3))),
+            ])),
+            Assign(v2, Or(Greater(v2, v1), 5)),
+            Assign(v0, Not(Less(5, v0))),
+        ])),
+        Assign(v0, Or(And(v0, v0), 6)),
+        If(Less(Sub(v0, v1), Greater(v2, v2)), Program([]), Program([
+            Assign(v0, 2),
+            Assign(v0, Not(v1)),
+        ])),
+    ]),
+    'random10': Program([
+        Write(i0, 1),
+        While(And(Greater(i0, 0), Equals(Negate(v0), Negate(v1))), Program([
+            Assign(v1, Div(Div(v0, Add(Mult(5, 5), 1)), Add(Mult(Equals(2, v1), Equals(2, v1)), 1))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Less(Div(v0, Add(Mult(v1, v1), 1)), Greater(v1, v2)), Program([
+            Assign(v2, v1),
+            Assign(v0, v2),
+            Assign(v2, Sub(v1, Mult(v0, v0))),
+            Assign(v1, Equals(v2, Sub(v1, v2))),
+        ]), Program([
+            Assign(v0, Or(Div(v1, Add(Mult(v2, v2), 1)), v1)),
+            Write(i1, 3),
+            While(And(Greater(i1, 0), Less(Mult(v1, 7), 8)), Program([
+                If(Greater(And(v2, v0), Equals(2, v2)), Program([
+                    Assign(v2, Mult(Sub(6, 0), 7)),
+                ]), Program([])),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v2, 7),
+            Assign(v1, Greater(v2, v2)),
+        ])),
+        Write(i2, 3),
+        While(Greater(i2, 0), Program([
+            Assign(v0, Less(Div(v2, Add(Mult(1, 1), 1)), Sub(4, v1))),
+            Assign(i2, Sub(i2, 1)),
+        ])),
+    ]),
+    'random11': Program([
+        If(Equals(Not(v2), Not(1)), Program([
+            If(Less(Negate(v1), Negate(2)), Program([
+                Write(i0, 0),
+                While(And(Greater(i0, 0), Equals(Not(8), v0)), Program([
+                    Assign(v0, v0),
+                    Assign(i0, Sub(i0, 1)),
+                ])),
+            ]), Program([
+                Assign(v2, 1),
+            ])),
+            Assign(v1, Greater(v0, And(v0, 0))),
+            Assign(v0, Add(Less(v2, v2), v1)),
+        ]), Program([
+            Assign(v1, Sub(0, 2)),
+            Write(i1, 0),
+            While(Greater(i1, 0), Program([
+                If(Equals(Sub(v0, v2), Add(v1, 9)), Program([
+                    Assign(v2, 3),
+                ]), Program([])),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Write(i2, 3),
+            While(Greater(i2, 0), Program([
+                Assign(v1, v2),
+                Assign(v0, v2),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Assign(v0, Mult(And(9, v0), v2)),
+        ])),
+    ]),
+    'random12': Program([
+        If(Greater(Mult(v1, v2), Not(v0)), Program([]), Program([
+            Write(i0, 3),
+            While(And(Greater(i0, 0), Less(Not(v2), Greater(v0, v1))), Program([
+                If(Equals(Add(v0, v2), Negate(v0)), Program([
+                    Assign(v0, Negate(Sub(6, 1))),
+                ]), Program([])),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            If(Greater(Div(v1, Add(Mult(4, 4), 1)), Less(v0, v1)), Program([
+                Assign(v1, Greater(v1, v2)),
+            ]), Program([])),
+        ])),
+        If(Less(Sub(3, v2), v1), Program([]), Program([
+            Assign(v2, Add(Or(v1, v2), Equals(v0, v2))),
+        ])),
+        Assign(v0, 9),
+        Assign(v1, Or(8, v1)),
+        Write(i1, 3),
+        While(Greater(i1, 0), Program([
+            Assign(v1, Negate(Negate(v2))),
+            Assign(v1, Or(2, Not(4))),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+        Assign(v2, v2),
+        Assign(v2, v1),
+    ]),
+    'random13': Program([
+        Assign(v1, Negate(Mult(v2, v0))),
+        Assign(v0, 4),
+        Assign(v1, v0),
+        Assign(v0, 4),
+        If(Equals(Div(v1, Add(Mult(v2, v2), 1)), Less(v2, v2)), Program([
+            Assign(v2, Not(Mult(v2, v0))),
+            Assign(v0, v1),
+            If(Equals(Mult(v2, v0), Or(v1, v1)), Program([]), Program([
+                If(Less(v2, Negate(v2)), Program([]), Program([
+                    Assign(v2, Or(5, Negate(v2))),
+                ])),
+            ])),
+        ]), Program([
+            Write(i0, 0),
+            While(And(Greater(i0, 0), Less(Not(v1), 8)), Program([
+                Assign(v1, v2),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+        ])),
+        Assign(v0, v2),
+        Write(i1, 2),
+        While(And(Greater(i1, 0), Less(v1, Greater(v1, v0))), Program([
+            Assign(v1, Greater(1, And(v2, v1))),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+    ]),
+    'random14': Program([
+        Assign(v2, Negate(Div(v0, Add(Mult(v1, v1), 1)))),
+        If(Greater(Less(1, v1), And(v2, v0)), Program([
+            Assign(v2, And(v0, Add(v0, 6))),
+            Assign(v2, Equals(Sub(1, v2), Mult(7, v0))),
+        ]), Program([
+            Assign(v1, Equals(Greater(v0, 1), v0)),
+            If(Equals(Negate(v1), Equals(v1, v0)), Program([
+                Assign(v1, Equals(Equals(v0, v1), Add(6, 6))),
+            ]), Program([])),
+        ])),
+        Assign(v1, Or(And(v2, v2), And(v0, v1))),
+        Assign(v0, And(Or(1, v0), Add(v2, v0))),
+        Assign(v2, Or(5, 2)),
+        Write(i0, 3),
+        While(Greater(i0, 0), Program([
+            Assign(v1, Less(Or(v2, v2), Equals(1, v0))),
+            Assign(v0, 3),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v2, Add(And(8, v0), Sub(v2, v0))),
+        Assign(v0, Negate(Not(v2))),
+    ]),
+    'random15': Program([
+        Assign(v0, Add(0, 2)),
+        Assign(v0, v1),
+        Assign(v1, v0),
+        Assign(v1, 8),
+        If(Equals(Equals(v2, 7), Negate(v0)), Program([]), Program([
+            If(Less(Not(0), v0), Program([
+                Assign(v1, v2),
+            ]), Program([])),
+            Assign(v1, Div(v0, Add(Mult(5, 5), 1))),
+            Assign(v1, Equals(Equals(4, v0), Less(v1, 1))),
+        ])),
+        Assign(v0, 4),
+        Assign(v1, Equals(v0, Equals(v2, v2))),
+        Assign(v2, v1),
+        If(Less(And(v1, v0), Less(v2, 9)), Program([
+            Assign(v2, v1),
+        ]), Program([
+            Assign(v1, Div(2, Add(Mult(Or(v0, v2), Or(v0, v2)), 1))),
+        ])),
+    ]),
+    'random16': Program([
+        Assign(v1, Less(v2, Div(v1, Add(Mult(v0, v0), 1)))),
+        Assign(v2, Add(Not(v0), Negate(v1))),
+        If(Greater(v1, Less(5, v2)), Program([]), Program([
+            Assign(v2, v0),
+            Assign(v2, Equals(v1, Mult(v2, 7))),
+            If(Greater(Equals(1, v0), Div(v0, Add(Mult(5, 5), 1))), Program([]), Program([
+                Assign(v2, Or(Negate(1), v0)),
+            ])),
+            Write(i0, 0),
+            While(Greater(i0, 0), Program([
+                Assign(v0, Add(Sub(0, 6), v1)),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v2, v2),
+            Assign(v1, Add(Equals(v0, v2), v2)),
+            If(Less(Sub(v1, v1), 6), Program([
+                Assign(v2, v2),
+            ]), Program([])),
+        ])),
+        If(Less(Add(v2, v0), And(3, v1)), Program([]), Program([
+            Assign(v2, Mult(Sub(1, 5), v1)),
+        ])),
+    ]),
+    'random17': Program([
+        Write(i0, 0),
+        While(Greater(i0, 0), Program([
+            Assign(v1, 8),
+            Assign(v0, Div(v0, Add(Mult(Less(v2, 6), Less(v2, 6)), 1))),
+            Assign(v0, Greater(Negate(v2), 1)),
+            Assign(v1, 7),
+            Write(i1, 1),
+            While(And(Greater(i1, 0), Less(v0, Or(v0, 3))), Program([
+                Assign(v1, Or(v0, Or(v1, v0))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v2, Or(Or(v2, v1), Add(5, v2))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v1, 7),
+        Assign(v2, Negate(v2)),
+        If(Equals(Negate(v0), 4), Program([
+            Assign(v1, 1),
+            Assign(v1, Negate(Equals(v0, v0))),
+        ]), Program([])),
+        Assign(v2, Not(v2)),
+        Assign(v2, Equals(v2, Equals(3, v0))),
+    ]),
+    'random18': Program([
+        Assign(v0, Or(7, v1)),
+        Assign(v1, Sub(Negate(2), Div(9, Add(Mult(v0, v0), 1)))),
+        Write(i0, 2),
+        While(Greater(i0, 0), Program([
+            If(Equals(3, Less(v2, v1)), Program([]), Program([
+                Assign(v2, Greater(v2, v2)),
+            ])),
+            Assign(v0, v1),
+            Assign(v1, Not(9)),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Write(i1, 0),
+        While(And(Greater(i1, 0), Greater(Mult(v2, 6), v1)), Program([
+            Assign(v1, v0),
+            Assign(v2, v2),
+            If(Greater(Sub(v1, v1), 5), Program([
+                Assign(v1, Not(Mult(v2, 8))),
+            ]), Program([])),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+        Assign(v2, Less(Equals(v1, 2), 2)),
+        Assign(v2, Equals(5, Mult(8, v0))),
+        Assign(v0, v0),
+    ]),
+    'random19': Program([
+        Assign(v2, v1),
+        Write(i0, 1),
+        While(Greater(i0, 0), Program([
+            Write(i1, 0),
+            While(Greater(i1, 0), Program([
+                Write(i2, 0),
+                While(Greater(i2, 0), Program([
+                    Assign(v1, And(Or(0, v0), Div(v2, Add(Mult(v1, v1), 1)))),
+                    Assign(i2, Sub(i2, 1)),
+                ])),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Write(i3, 3),
+            While(And(Greater(i3, 0), Less(Equals(v1, 9), v2)), Program([
+                Assign(v1, And(Greater(6, v2), Sub(6, v0))),
+                Assign(i3, Sub(i3, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v0, v1),
+        Assign(v2, And(Equals(v1, v0), And(v0, v1))),
+        If(Less(Equals(v0, v2), v0), Program([]), Program([
+            Assign(v1, Sub(v2, Less(v2, v1))),
+        ])),
+        Write(i4, 3),
+        While(Greater(i4, 0), Program([
+            Assign(v2, Not(Or(3, v1))),
+            Assign(v0, Negate(Sub(v2, v2))),
+            Assign(v1, And(And(v2, v2), Less(0, 3))),
+            Assign(i4, Sub(i4, 1)),
+        ])),
+    ]),
+    'random20': Program([
+        Assign(v1, Sub(Not(0), Sub(v1, v2))),
+        If(Less(Negate(v1), v1), Program([
+            If(Greater(v0, v1), Program([
+                Assign(v2, v0),
+            ]), Program([])),
+            Assign(v2, 9),
+            Assign(v0, v1),
+        ]), Program([
+            Assign(v0, Or(Equals(4, v1), v2)),
+            Assign(v2, 6),
+            Assign(v0, v2),
+        ])),
+        Assign(v1, v0),
+        Assign(v1, v1),
+        If(Greater(v0, Greater(v0, v0)), Program([]), Program([
+            Assign(v1, v2),
+            Assign(v2, v0),
+        ])),
+        Assign(v2, Mult(v2, And(6, v1))),
+    ]),
+    'random21': Program([
+        Assign(v1, Negate(7)),
+        Write(i0, 3),
+        While(And(Greater(i0, 0), Greater(Sub(v1, v1), 8)), Program([
+            Write(i1, 0),
+            While(And(Greater(i1, 0), Equals(Less(v0, 8), Sub(v1, v2))), Program([
+                Assign(v0, Not(Mult(3, 3))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v0, Greater(Less(v0, v1), Div(v2, Add(Mult(v0, v0), 1)))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v1, Greater(Equals(v0, 2), Equals(v0, v2))),
+        Write(i2, 1),
+        While(And(Greater(i2, 0), Greater(And(v1, v0), Mult(v1, 2))), Program([
+            Write(i3, 3),
+            While(And(Greater(i3, 0), Less(Not(v1), Less(v0, v0))), Program([
+                Assign(v2, Sub(v1, Or(v2, 3))),
+                Assign(v0, 6),
+                Assign(v0, Negate(Negate(6))),
+                Assign(i3, Sub(i3, 1)),
+            ])),
+            Assign(i2, Sub(i2, 1)),
+        ])),
+        If(Less(Greater(7, v0), Or(5, v1)), Program([]), Program([
+            Assign(v2, Equals(Greater(v0, 0), Mult(0, v1))),
+        ])),
+        Assign(v2, Negate(Mult(v0, v0))),
+        Assign(v2, Mult(v1, v1)),
+    ]),
+    'random22': Program([
+        Assign(v0, 2),
+        Assign(v2, Or(Sub(v0, v2), v2)),
+        If(Greater(Not(v1), 9), Program([
+            Write(i0, 1),
+            While(Greater(i0, 0), Program([
+                Assign(v2, Or(4, Negate(v1))),
+                Assign(v2, Less(v0, And(v2, 6))),
+                Assign(v1, Less(And(v2, v1), Greater(v0, 5))),
+                Assign(v1, Add(Div(v1, Add(Mult(v1, v1), 1)), Mult(v1, 5))),
+                Assign(v1, Negate(v2)),
+                Assign(v2, Negate(Add(v0, 9))),
+                If(Equals(Mult(v2, 7), Sub(v1, 1)), Program([
+                    Assign(v1, Add(v0, Mult(v2, 6))),
+                ]), Program([])),
+                Assign(v0, 5),
+                Assign(v0, Greater(2, 9)),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v1, 8),
+        ]), Program([])),
+    ]),
+    'random23': Program([
+        Assign(v0, v1),
+        Write(i0, 2),
+        While(And(Greater(i0, 0), Less(v1, And(5, v1))), Program([
+            Assign(v2, v0),
+            Write(i1, 1),
+            While(Greater(i1, 0), Program([
+                Assign(v0, 6),
+                Assign(v2, Less(Add(v0, v2), v2)),
+                Assign(v2, Or(And(v1, v1), v1)),
+                Assign(v2, 8),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Equals(v0, Equals(v2, v2)), Program([
+            Write(i2, 1),
+            While(And(Greater(i2, 0), Greater(Greater(7, 5), 7)), Program([
+                Assign(v0, Add(v0, v0)),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Assign(v0, v1),
+            Assign(v0, v2),
+        ]), Program([
+            Assign(v2, Div(Or(v1, 9), Add(Mult(v0, v0), 1))),
+        ])),
+        Assign(v1, 3),
+    ]),
+    'random24': Program([
+        If(Less(v0, Sub(2, 4)), Program([
+            Assign(v1, Negate(v1)),
+            If(Equals(Sub(v1, 2), And(v2, v0)), Program([
+                Assign(v1, Sub(Div(7, Add(Mult(v0, v0), 1)), And(v1, 1))),
+            ]), Program([
+                Write(i0, 1),
+                While(And(Greater(i0, 0), Less(And(3, v0), v1)), Program([
+                    Assign(v2, v2),
+                    Assign(i0, Sub(i0, 1)),
+                ])),
+            ])),
+        ]), Program([
+            If(Equals(v1, v2), Program([
+                If(Equals(5, Sub(v1, 6)), Program([
+                    Assign(v1, Less(Div(v1, Add(Mult(v1, v1), 1)), Sub(0, 8))),
+                ]), Program([])),
+            ]), Program([
+                Assign(v2, Less(And(v1, v1), Add(v0, v0))),
+                Assign(v0, Greater(Not(v1), 1)),
+            ])),
+            Assign(v0, v2),
+            If(Equals(Sub(1, v2), Not(7)), Program([
+                Assign(v2, Negate(Equals(v1, v2))),
+            ]), Program([])),
+            Assign(v0, Div(Mult(v1, 9), Add(Mult(Mult(v1, v0), Mult(v1, v0)), 1))),
+        ])),
+    ]),
+    'random25': Program([
+        If(Less(7, 4), Program([]), Program([
+            Assign(v1, Sub(Sub(v2, 8), Not(v0))),
+            Write(i0, 3),
+            While(Greater(i0, 0), Program([
+                Write(i1, 1),
+                While(And(Greater(i1, 0), Equals(6, Or(2, v0))), Program([
+                    Assign(v0, Negate(Not(v1))),
+                    Assign(v0, Not(Sub(v0, v0))),
+                    Assign(v0, Sub(Div(v1, Add(Mult(8, 8), 1)), Negate(v0))),
+                    Assign(v1, 6),
+                    Assign(i1, Sub(i1, 1)),
+                ])),
+                Assign(v0, v1),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v1, Equals(Negate(v1), Sub(4, v0))),
+            Write(i2, 1),
+            While(Greater(i2, 0), Program([
+                Assign(v2, 4),
+                Write(i3, 0),
+                While(Greater(i3, 0), Program([
+                    Assign(v1, Add(0, 9)),
+                    Assign(i3, Sub(i3, 1)),
+                ])),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+        ])),
+        Assign(v1, 9),
+    ]),
+    'random26': Program([
+        Assign(v2, v0),
+        Assign(v1, v2),
+        Assign(v2, Div(Div(v1, Add(Mult(v0, v0), 1)), Add(Mult(Less(3, 0), Less(3, 0)), 1))),
+        Assign(v0, Add(8, Greater(v0, v2))),
+        Write(i0, 1),
+        While(And(Greater(i0, 0), Greater(Equals(v0, 0), Less(v1, v1))), Program([
+            Assign(v2, Div(Less(9, v0), Add(Mult(3, 3), 1))),
+            Assign(v0, v0),
+            Assign(v1, v0),
+            Write(i1, 0),
+            While(Greater(i1, 0), Program([
+                Assign(v1, Less(Not(v1), v0)),
+                Assign(v2, Or(Not(6), Equals(v2, v0))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v0, Add(Negate(8), 7)),
+        Assign(v2, Less(v0, And(v2, v1))),
+        If(Greater(Sub(0, v1), v1), Program([
+            Assign(v1, Negate(Add(v2, v0))),
+        ]), Program([])),
+    ]),
+    'random27': Program([
+        If(Equals(v2, Or(6, v0)), Program([
+            If(Greater(Not(v2), Less(7, 0)), Program([
+                If(Greater(Not(v2), Mult(v1, 0)), Program([
+                    Assign(v2, v0),
+                    Assign(v2, Mult(Negate(v0), Not(v0))),
+                ]), Program([
+                    Assign(v1, Equals(Or(v1, v1), Add(v0, v2))),
+                ])),
+                If(Equals(Less(v0, v2), Sub(v1, v0)), Program([]), Program([
+                    Assign(v0, Div(4, Add(Mult(Equals(v2, v2), Equals(v2, v2)), 1))),
+                ])),
+            ]), Program([
+                Assign(v2, Add(Less(0, v1), Not(v1))),
+            ])),
+        ]), Program([
+            Assign(v2, Less(Sub(v0, v0), v1)),
+            Write(i0, 0),
+            While(Greater(i0, 0), Program([
+                Assign(v0, And(v1, Div(3, Add(Mult(6, 6), 1)))),
+                Assign(v0, Or(Add(1, v2), Sub(v1, v0))),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+        ])),
+        Assign(v0, v2),
+        Assign(v0, Add(Greater(7, v0), v0)),
+    ]),
+    'random28': Program([
+        Assign(v2, v0),
+        Assign(v0, Less(v0, Mult(v0, v0))),
+        Assign(v0, Or(Mult(v2, v2), And(v2, v0))),
+        Assign(v1, And(v1, Not(v0))),
+        Assign(v1, v1),
+        Assign(v0, And(Less(2, v1), Div(v0, Add(Mult(8, 8), 1)))),
+        Assign(v0, 5),
+        If(Less(Greater(v1, v0), Div(v0, Add(Mult(v1, v1), 1))), Program([]), Program([
+            Assign(v0, Negate(Equals(v2, v0))),
+        ])),
+        If(Less(v0, Sub(v1, 9)), Program([
+            Assign(v1, 3),
+        ]), Program([
+            Assign(v2, Equals(Greater(v2, 6), Less(1, v2))),
+            Assign(v2, Greater(Sub(1, v1), 2)),
+        ])),
+        Assign(v1, v1),
+        Assign(v2, v0),
+    ]),
+    'random29': Program([
+        Write(i0, 2),
+        While(And(Greater(i0, 0), Greater(Div(v2, Add(Mult(v1, v1), 1)), Less(7, v1))), Program([
+            Assign(v2, And(6, Add(v1, v1))),
+            Assign(v1, Not(Div(v1, Add(Mult(v0, v0), 1)))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Write(i1, 0),
+        While(Greater(i1, 0), Program([
+            If(Greater(Or(4, v1), Greater(v1, v1)), Program([
+                If(Equals(Negate(3), Add(0, v1)), Program([
+                    Assign(v0, And(Add(4, v2), Add(8, 2))),
+                    Assign(v2, Div(Mult(v2, 2), Add(Mult(4, 4), 1))),
+                ]), Program([
+                    Assign(v2, Div(v0, Add(Mult(v2, v2), 1))),
+                ])),
+                Write(i2, 3),
+                While(And(Greater(i2, 0), Less(Less(v0, v2), v1)), Program([
+                    Assign(v2, v1),
+                    Assign(i2, Sub(i2, 1)),
+                ])),
+            ]), Program([
+                Assign(v2, Mult(v1, 6)),
+            ])),
+            Write(i3, 3),
+            While(Greater(i3, 0), Program([
+                Assign(v0, Add(Div(v2, Add(Mult(v1, v1), 1)), Or(v0, 7))),
+                Assign(i3, Sub(i3, 1)),
+            ])),
+            Assign(v1, 3),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+    ]),
+    'random30': Program([
+        Write(i0, 0),
+        While(And(Greater(i0, 0), Equals(Div(v1, Add(Mult(v1, v1), 1)), Sub(v1, 9))), Program([
+            Assign(v2, v0),
+            Assign(v0, Negate(v0)),
+            Write(i1, 3),
+            While(Greater(i1, 0), Program([
+                Assign(v0, Not(Less(5, v0))),
+                If(Greater(Less(v2, v2), Sub(v1, v1)), Program([
+                    Assign(v1, Mult(v0, 6)),
+                ]), Program([])),
+                Assign(v2, Greater(Equals(v2, v2), Greater(v0, 1))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v1, v2),
+            Assign(v2, v1),
+            If(Less(Less(9, v1), Less(v2, 7)), Program([
+                Assign(v1, Mult(Greater(0, v0), 5)),
+                Assign(v0, And(Negate(v2), Add(v2, v1))),
+            ]), Program([
+                Assign(v1, Mult(8, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v1, 1),
+    ]),
+    'random31': Program([
+        Assign(v1, v2),
+        Assign(v0, Greater(2, Add(v0, v2))),
+        If(Less(Sub(v1, v0), Or(v0, v0)), Program([
+            If(Less(Div(v2, Add(Mult(v1, v1), 1)), Equals(v0, v1)), Program([
+                Assign(v1, v0),
+            ]), Program([])),
+            Assign(v0, v2),
+        ]), Program([
+            If(Less(Sub(4, 8), Greater(4, v0)), Program([
+                Assign(v2, Sub(And(3, v0), Equals(v0, v0))),
+                Assign(v0, Negate(v1)),
+            ]), Program([
+                Assign(v2, Mult(Equals(v2, v1), Equals(v0, 7))),
+                Assign(v2, Equals(Add(v1, v0), v1)),
+            ])),
+            Assign(v0, v2),
+        ])),
+        Assign(v2, Div(Greater(v2, v2), Add(Mult(And(v2, v2), And(v2, v2)), 1))),
+        If(Equals(v1, And(v2, 0)), Program([]), Program([
+            Assign(v0, Div(4, Add(Mult(v1, v1), 1))),
+        ])),
+    ]),
+    'random32': Program([
+        Assign(v0, v0),
+        If(Less(Or(8, v1), Add(v0, v1)), Program([
+            Assign(v0, Div(Less(v0, v0), Add(Mult(Or(v2, v0), Or(v2, v0)), 1))),
+        ]), Program([])),
+        Assign(v1, Equals(4, Not(v0))),
+        Write(i0, 2),
+        While(Greater(i0, 0), Program([
+            Assign(v1, Div(Equals(v0, 2), Add(Mult(And(v0, 0), And(v0, 0)), 1))),
+            Assign(v0, Mult(Div(v2, Add(Mult(v1, v1), 1)), 5)),
+            Assign(v1, Div(Or(v2, v2), Add(Mult(Greater(v0, v1), Greater(v0, v1)), 1))),
+            Assign(v2, Not(v0)),
+            Assign(v0, Mult(Or(6, 7), 6)),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Equals(3, v1), Program([
+            Assign(v2, Less(9, Mult(0, 3))),
+        ]), Program([
+            Assign(v2, Less(v0, Mult(v1, v2))),
+        ])),
+        Assign(v0, And(v1, 8)),
+        Assign(v2, Negate(v0)),
+    ]),
+    'random33': Program([
+        Write(i0, 1),
+        While(Greater(i0, 0), Program([
+            Assign(v1, Greater(Mult(9, 8), Negate(v1))),
+            Assign(v2, And(Greater(v0, 6), And(8, 3))),
+            Assign(v0, And(Sub(1, v0), Or(v2, v2))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v0, Negate(Greater(1, v0))),
+        Assign(v0, v0),
+        Assign(v2, Equals(Or(v1, 4), Add(v1, 5))),
+        Assign(v2, Add(Negate(v1), Mult(9, v2))),
+        Assign(v2, And(Less(6, v2), Equals(v1, v1))),
+        Assign(v0, Or(And(2, 5), Less(5, 5))),
+        Write(i1, 3),
+        While(And(Greater(i1, 0), Less(v0, Greater(v0, 2))), Program([
+            Assign(v2, Add(v1, Sub(v0, 3))),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+        Assign(v0, Mult(Add(v0, 3), Or(v2, v1))),
+        Assign(v2, Add(Equals(9, v2), v1)),
+        Assign(v1, And(v0, And(v1, v0))),
+    ]),
+    'random34': Program([
+        Write(i0, 0),
+        While(Greater(i0, 0), Program([
+            Write(i1, 1),
+            While(Greater(i1, 0), Program([
+                Assign(v0, Or(Sub(v1, v2), Mult(v1, 9))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Write(i2, 3),
+            While(And(Greater(i2, 0), Less(Negate(v1), Div(v2, Add(Mult(v0, v0), 1)))), Program([
+                Assign(v1, v0),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Write(i3, 2),
+            While(Greater(i3, 0), Program([
+                Assign(v0, Sub(Sub(4, v2), 2)),
+                Assign(i3, Sub(i3, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Write(i4, 2),
+        While(Greater(i4, 0), Program([
+            If(Equals(v0, v1), Program([
+                Assign(v0, And(Div(5, Add(Mult(v1, v1), 1)), Not(7))),
+            ]), Program([
+                Assign(v0, Or(Mult(6, 5), Negate(v2))),
+                Write(i5, 1),
+                While(Greater(i5, 0), Program([
+                    Assign(v2, Mult(v0, 8)),
+                    Assign(i5, Sub(i5, 1)),
+                ])),
+            ])),
+            Assign(v2, Mult(Mult(5, 6), 2)),
+            Assign(i4, Sub(i4, 1)),
+        ])),
+        Assign(v0, And(Equals(8, 9), Equals(v1, v2))),
+    ]),
+    'random35': Program([
+        Write(i0, 1),
+        While(Greater(i0, 0), Program([
+            Assign(v2, Mult(9, 0)),
+            Write(i1, 1),
+            While(And(Greater(i1, 0), Greater(Sub(v0, v2), 3)), Program([
+                Assign(v2, Sub(Greater(v2, v2), v0)),
+                Assign(v0, Sub(v0, Or(v0, v2))),
+                Assign(v2, Equals(Equals(v2, v1), Equals(v0, 1))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v0, v0),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v0, Equals(Add(v2, 2), Greater(v1, 0))),
+        If(Greater(v1, And(v2, v2)), Program([]), Program([
+            Assign(v2, Or(Negate(6), 7)),
+            Assign(v0, Or(Greater(v1, v2), Div(v1, Add(Mult(v0, v0), 1)))),
+            Write(i2, 2),
+            While(Greater(i2, 0), Program([
+                Assign(v2, Sub(Greater(v2, v2), Equals(3, 3))),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Assign(v0, Greater(Equals(2, 1), Not(v0))),
+        ])),
+        Assign(v2, v1),
+    ]),
+    'random36': Program([
+        Assign(v0, And(Add(v0, v2), Or(v2, v1))),
+        If(Equals(Less(v2, v0), Mult(v2, v2)), Program([
+            Assign(v0, Less(Equals(v0, v1), Equals(4, v0))),
+            Assign(v2, Greater(1, And(v0, v2))),
+        ]), Program([
+            Assign(v1, Greater(v1, v2)),
+            Assign(v0, v0),
+            Assign(v0, Mult(Sub(v1, 4), v2)),
+            Assign(v1, 6),
+            Assign(v0, Less(v0, v0)),
+        ])),
+        Assign(v0, v1),
+        Write(i0, 3),
+        While(Greater(i0, 0), Program([
+            Assign(v2, v0),
+            Assign(v0, Or(v1, Sub(v1, v1))),
+            If(Greater(Not(9), Or(2, v0)), Program([
+                Assign(v2, And(Negate(v2), Sub(v1, v2))),
+            ]), Program([])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+    ]),
+    'random37': Program([
+        Write(i0, 2),
+        While(Greater(i0, 0), Program([
+            Write(i1, 0),
+            While(And(Greater(i1, 0), Equals(Not(v2), Add(9, v1))), Program([
+                Assign(v1, Sub(Equals(v1, 6), Add(v0, v1))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v2, Add(Greater(v0, 3), And(v2, v1))),
+        Write(i2, 1),
+        While(And(Greater(i2, 0), Equals(Sub(v0, v0), v2)), Program([
+            Assign(v1, Equals(v2, v2)),
+            Assign(i2, Sub(i2, 1)),
+        ])),
+        Write(i3, 1),
+        While(And(Greater(i3, 0), Greater(Mult(v2, 1), v1)), Program([
+            Write(i4, 0),
+            While(And(Greater(i4, 0), Greater(Greater(v2, v2), Div(v1, Add(Mult(4, 4), 1)))), Program([
+                If(Greater(Mult(v2, 2), Greater(v2, v1)), Program([
+                    Assign(v2, Div(7, Add(Mult(Less(v0, v1), Less(v0, v1)), 1))),
+                ]), Program([])),
+                Assign(i4, Sub(i4, 1)),
+            ])),
+            Assign(v2, Div(Or(5, v0), Add(Mult(Not(v0), Not(v0)), 1))),
+            Assign(i3, Sub(i3, 1)),
+        ])),
+        Assign(v2, Equals(Sub(v0, v1), Div(1, Add(Mult(v0, v0), 1)))),
+        Assign(v2, And(Sub(v0, v0), Mult(v2, v2))),
+        Assign(v2, And(v2, Less(4, 8))),
+        Assign(v0, Greater(Div(v1, Add(Mult(2, 2), 1)), Div(9, Add(Mult(1, 1), 1)))),
+    ]),
+    'random38': Program([
+        If(Less(Equals(v2, v2), And(9, 7)), Program([
+            Write(i0, 2),
+            While(Greater(i0, 0), Program([
+                Assign(v2, v1),
+                Write(i1, 3),
+                While(Greater(i1, 0), Program([
+                    Assign(v1, Greater(Not(v0), And(v0, 1))),
+                    Assign(i1, Sub(i1, 1)),
+                ])),
+                Assign(v2, v1),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v1, v2),
+        ]), Program([
+            Assign(v0, 3),
+        ])),
+        Assign(v2, Mult(Less(3, 1), 8)),
+        Write(i2, 2),
+        While(Greater(i2, 0), Program([
+            Write(i3, 0),
+            While(Greater(i3, 0), Program([
+                Assign(v1, v2),
+                Assign(i3, Sub(i3, 1)),
+            ])),
+            Assign(v1, Mult(Greater(9, v2), 4)),
+            Assign(i2, Sub(i2, 1)),
+        ])),
+        Assign(v2, Sub(Greater(v0, v0), Add(v2, v0))),
+        Assign(v2, Sub(Equals(v1, v0), And(7, v0))),
+    ]),
+    'random39': Program([
+        Assign(v1, Div(And(v2, v0), Add(Mult(0, 0), 1))),
+        Assign(v2, Sub(Sub(v1, 1), Greater(v1, 7))),
+        If(Equals(Add(v2, 7), Negate(v1)), Program([
+            Assign(v1, Equals(v0, v1)),
+        ]), Program([
+            Assign(v2, Sub(Equals(8, v0), 6)),
+            Assign(v2, Negate(Mult(8, v0))),
+            Write(i0, 0),
+            While(And(Greater(i0, 0), Greater(5, Mult(v0, 9))), Program([
+                Assign(v0, Div(Greater(v2, 8), Add(Mult(Div(v1, Add(Mult(v0, v0), 1)), Div(v1, Add(Mult(v0, v0), 1))), 1))),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+        ])),
+        Assign(v0, Negate(Sub(8, v1))),
+        Assign(v2, v1),
+        Write(i1, 1),
+        While(And(Greater(i1, 0), Less(Negate(v1), Negate(v2))), Program([
+            Assign(v1, v0),
+            Assign(i1, Sub(i1, 1)),
+        ])),
+        Assign(v1, Equals(Add(7, v1), v2)),
+        Write(i2, 1),
+        While(Greater(i2, 0), Program([
+            Assign(v0, Add(Negate(v0), Div(v2, Add(Mult(1, 1), 1)))),
+            Assign(i2, Sub(i2, 1)),
+        ])),
+    ]),
+    'random40': Program([
+        If(Less(v2, Mult(4, 7)), Program([
+            Assign(v2, Mult(v2, Add(v2, v1))),
+            Assign(v0, Negate(Sub(v0, 5))),
+        ]), Program([
+            Assign(v0, And(v1, Mult(3, v2))),
+            Assign(v0, Not(Add(v2, v0))),
+            Assign(v1, Equals(Or(v1, v2), Div(9, Add(Mult(v0, v0), 1)))),
+            If(Equals(3, Less(v0, 7)), Program([]), Program([
+                Assign(v0, 1),
+                Assign(v1, v0),
+            ])),
+            Assign(v0, Div(Greater(v2, 0), Add(Mult(v1, v1), 1))),
+            Assign(v2, And(Add(v1, v1), Add(v2, v2))),
+        ])),
+        If(Greater(Add(v0, v0), And(1, v2)), Program([]), Program([
+            Write(i0, 1),
+            While(And(Greater(i0, 0), Less(3, Not(v0))), Program([
+                Assign(v0, v0),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+        ])),
+        Assign(v0, Div(Less(v1, 7), Add(Mult(Equals(v2, v1), Equals(v2, v1)), 1))),
+    ]),
+    'random41': Program([
+        If(Less(Less(v2, v1), Not(v0)), Program([
+            Assign(v1, Mult(Or(v2, v2), 0)),
+            If(Less(v1, v0), Program([]), Program([
+                Assign(v0, Mult(v2, v1)),
+                Assign(v1, Sub(Less(v2, v1), v0)),
+            ])),
+            Assign(v2, Greater(Greater(v0, v1), 0)),
+        ]), Program([
+            Assign(v2, Sub(Mult(6, v2), v2)),
+        ])),
+        Assign(v0, v1),
+        If(Greater(v2, v2), Program([
+            Assign(v2, And(Sub(v0, v0), v0)),
+            Assign(v2, Mult(Sub(v2, 7), Div(v1, Add(Mult(v1, v1), 1)))),
+            Assign(v1, v0),
+            Assign(v0, Negate(Less(1, v2))),
+        ]), Program([])),
+        Write(i0, 3),
+        While(Greater(i0, 0), Program([
+            Assign(v2, And(v1, Sub(4, v1))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+    ]),
+    'random42': Program([
+        Assign(v0, Div(v0, Add(Mult(8, 8), 1))),
+        Assign(v0, v2),
+        Assign(v2, Greater(Equals(v0, 2), Or(v0, 5))),
+        Assign(v0, Or(Not(v0), Greater(v1, v1))),
+        Write(i0, 1),
+        While(Greater(i0, 0), Program([
+            Write(i1, 2),
+            While(And(Greater(i1, 0), Greater(Div(v0, Add(Mult(v0, v0), 1)), Less(v0, 9))), Program([
+                Assign(v0, And(Div(v2, Add(Mult(6, 6), 1)), Mult(v0, 4))),
+                Assign(v2, Not(Greater(2, v1))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v2, Negate(And(v2, v1))),
+            Write(i2, 0),
+            While(And(Greater(i2, 0), Equals(Equals(v2, 0), Sub(v2, 5))), Program([
+                Assign(v1, Mult(Sub(1, v0), 6)),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Greater(Greater(4, 8), Mult(v0, v2)), Program([]), Program([
+            Assign(v2, Add(v1, v2)),
+        ])),
+        Assign(v0, Sub(Greater(2, v2), v2)),
+        Assign(v0, Div(Div(v2, Add(Mult(v1, v1), 1)), Add(Mult(Less(5, v2), Less(5, v2)), 1))),
+    ]),
+    'random43': Program([
+        Assign(v1, Mult(Or(v0, v1), Greater(v1, v2))),
+        If(Less(Sub(v0, v1), v2), Program([
+            Assign(v2, v2),
+            Assign(v0, Mult(8, Not(v2))),
+            Assign(v0, Equals(Or(v2, 2), v1)),
+            Assign(v2, 9),
+            Assign(v2, And(Or(0, v1), Sub(v2, v2))),
+        ]), Program([
+            Assign(v2, Sub(Less(v0, v0), Sub(v0, 5))),
+            Assign(v2, And(Equals(6, v0), v2)),
+        ])),
+        If(Greater(Not(v1), Add(v0, 3)), Program([]), Program([
+            Assign(v2, v1),
+            Assign(v0, Less(v0, v2)),
+        ])),
+        Write(i0, 0),
+        While(Greater(i0, 0), Program([
+            Assign(v1, v1),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v2, v1),
+    ]),
+    'random44': Program([
+        If(Greater(Mult(v1, v0), Sub(v2, v1)), Program([
+            Assign(v2, Less(Negate(v0), And(v0, v2))),
+        ]), Program([
+            Assign(v1, Sub(And(v1, v1), Div(v0, Add(Mult(v2, v2), 1)))),
+            Assign(v2, Negate(Add(5, v1))),
+            If(Less(v2, Or(v2, v0)), Program([
+                Assign(v0, Not(Negate(v1))),
+            ]), Program([
+                Assign(v2, v1),
+                Assign(v0, Add(Add(v1, v0), Add(v1, 1))),
+                Assign(v0, v2),
+                Assign(v2, Add(4, Greater(9, v1))),
+            ])),
+        ])),
+        Assign(v1, Less(Greater(7, v1), v0)),
+        Assign(v1, Or(Sub(v2, 4), Greater(3, v0))),
+        Write(i0, 3),
+        While(And(Greater(i0, 0), Equals(Equals(v0, v1), Negate(v1))), Program([
+            Assign(v2, v0),
+            Assign(v1, 5),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+    ]),
+    'random45': Program([
+        Assign(v1, Sub(Add(v0, v0), Negate(v2))),
+        Assign(v0, 2),
+        Assign(v2, Not(Add(2, v1))),
+        Assign(v0, Add(Or(8, v2), Negate(v2))),
+        Assign(v1, Div(Not(v0), Add(Mult(Negate(3), Negate(3)), 1))),
+        If(Less(Greater(v1, v2), Add(v2, v2)), Program([
+            Assign(v1, Mult(v1, Sub(v2, 9))),
+        ]), Program([
+            Assign(v1, Or(v2, Negate(v0))),
+            Assign(v0, And(Sub(v0, 1), v1)),
+            Write(i0, 3),
+            While(Greater(i0, 0), Program([
+                Assign(v2, Equals(Less(v1, v1), Mult(0, 1))),
+                Assign(i0, Sub(i0, 1)),
+            ])),
+            Assign(v1, Not(6)),
+            Assign(v2, Negate(Add(7, v2))),
+        ])),
+        Assign(v0, Div(Or(8, 6), Add(Mult(Add(v2, 9), Add(v2, 9)), 1))),
+        Assign(v0, Less(Equals(6, v1), v0)),
+    ]),
+    'random46': Program([
+        Assign(v1, v0),
+        Write(i0, 2),
+        While(And(Greater(i0, 0), Equals(Mult(v1, 3), Not(v2))), Program([
+            Write(i1, 3),
+            While(And(Greater(i1, 0), Less(Equals(v1, v0), Greater(v1, v2))), Program([
+                Assign(v0, Negate(Add(v1, v2))),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v1, v0),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v1, Or(Or(v2, v2), Greater(v1, v1))),
+        Assign(v2, 2),
+        Assign(v1, Add(Add(v0, v0), v0)),
+        Assign(v1, And(Equals(v0, 4), Less(v0, v0))),
+        If(Greater(Greater(0, v1), And(v0, v2)), Program([
+            Assign(v2, Add(Greater(v0, 5), v0)),
+        ]), Program([
+            Assign(v0, Not(Div(v0, Add(Mult(v1, v1), 1)))),
+            Assign(v2, Negate(Sub(v2, v1))),
+        ])),
+        Assign(v1, Div(And(v0, v0), Add(Mult(v2, v2), 1))),
+        Assign(v1, 5),
+    ]),
+    'random47': Program([
+        Assign(v0, Equals(And(v1, v1), Sub(v1, 0))),
+        Assign(v2, Div(Or(v2, v0), Add(Mult(Or(v0, v1), Or(v0, v1)), 1))),
+        Assign(v2, Add(v2, Greater(1, v0))),
+        Assign(v0, Sub(Not(v1), Div(v2, Add(Mult(4, 4), 1)))),
+        Assign(v1, Less(3, Negate(6))),
+        If(Greater(v0, Sub(v2, 8)), Program([
+            Assign(v1, Add(Negate(v2), Negate(5))),
+        ]), Program([
+            Assign(v2, v2),
+            Assign(v0, Div(Less(v1, v0), Add(Mult(v2, v2), 1))),
+            If(Less(v2, Equals(v1, v2)), Program([]), Program([
+                Assign(v0, Mult(Greater(v0, 3), Less(v0, v2))),
+            ])),
+        ])),
+        Assign(v0, Greater(v1, Not(v1))),
+        Assign(v2, v1),
+        Assign(v1, Equals(Sub(1, 7), Less(8, 1))),
+        Assign(v2, Sub(Or(2, v2), v1)),
+    ]),
+    'random48': Program([
+        Write(i0, 3),
+        While(And(Greater(i0, 0), Equals(v1, Or(v2, 6))), Program([
+            Assign(v2, And(Greater(v1, v2), v0)),
+            Write(i1, 0),
+            While(And(Greater(i1, 0), Greater(Negate(v2), Div(v1, Add(Mult(v2, v2), 1)))), Program([
+                If(Less(Mult(v0, 2), v1), Program([
+                    Assign(v1, v1),
+                ]), Program([])),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            Assign(v2, v0),
+            Assign(v0, v2),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        If(Less(Div(v2, Add(Mult(v2, v2), 1)), Mult(v0, v2)), Program([
+            Write(i2, 1),
+            While(Greater(i2, 0), Program([
+                Write(i3, 0),
+                While(And(Greater(i3, 0), Greater(Not(v1), v2)), Program([
+                    Assign(v1, Add(Greater(v2, v0), Negate(v1))),
+                    Assign(i3, Sub(i3, 1)),
+                ])),
+                Assign(i2, Sub(i2, 1)),
+            ])),
+        ]), Program([
+            Assign(v2, Div(Or(6, v0), Add(Mult(Or(v2, v1), Or(v2, v1)), 1))),
+            Assign(v0, Equals(Sub(v0, v0), Not(v0))),
+        ])),
+        Assign(v1, v2),
+        Assign(v0, v0),
+    ]),
+    'random49': Program([
+        Assign(v1, Sub(Greater(v0, v2), v0)),
+        Write(i0, 0),
+        While(And(Greater(i0, 0), Equals(Sub(v2, v2), v1)), Program([
+            Assign(v2, v0),
+            Assign(v2, v1),
+            Assign(v1, v2),
+            Write(i1, 3),
+            While(And(Greater(i1, 0), Greater(Or(v0, v2), Not(v2))), Program([
+                Assign(v1, Not(1)),
+                Assign(i1, Sub(i1, 1)),
+            ])),
+            If(Greater(0, v1), Program([]), Program([
+                Assign(v0, Or(Add(v1, 7), v2)),
+                Assign(v0, v0),
+            ])),
+            Assign(v2, Equals(Negate(v2), Div(v0, Add(Mult(v2, v2), 1)))),
+            Assign(i0, Sub(i0, 1)),
+        ])),
+        Assign(v1, Negate(Greater(7, v2))),
+        If(Greater(v1, Or(8, v2)), Program([]), Program([
+            Assign(v0, v0),
+        ])),
+        Assign(v1, 8),
+    ]),
+}
+
+inputs = {
+    'random0': [{'v0': 4, 'v1': 5, 'v2': -7}, {'v0': 0, 'v1': 8, 'v2': 7}, {'v0': 4, 'v1': 1, 'v2': 7}, {'v0': 3, 'v1': 10, 'v2': -2}, {'v0': 8, 'v1': -4, 'v2': 1}, {'v0': -4, 'v1': -5, 'v2': 11}, {'v0': 0, 'v1': 9, 'v2': 14}, {'v0': 11, 'v1': -4, 'v2': 1}],
+    'random1': [{'v0': -4, 'v1': 10, 'v2': -6}, {'v0': 0, 'v1': -5, 'v2': 7}, {'v0': 6, 'v1': 7, 'v2': 12}, {'v0': 4, 'v1': -2, 'v2': -5}, {'v0': 7, 'v1': -8, 'v2': 4}, {'v0': 5, 'v1': 11, 'v2': -8}, {'v0': 14, 'v1': 6, 'v2': 0}, {'v0': 15, 'v1': -1, 'v2': 10}],
+    'random2': [{'v0': -7, 'v1': -6, 'v2': -6}, {'v0': 3, 'v1': -3, 'v2': 15}, {'v0': 13, 'v1': 1, 'v2': 0}, {'v0': 11, 'v1': -2, 'v2': 11}, {'v0': -7, 'v1': 10, 'v2': 13}, {'v0': -3, 'v1': 5, 'v2': 12}, {'v0': 4, 'v1': 15, 'v2': 8}, {'v0': 3, 'v1': 9, 'v2': 6}],
+    'random3': [{'v0': -1, 'v1': 10, 'v2': 9}, {'v0': -4, 'v1': 3, 'v2': 11}, {'v0': 7, 'v1': 12, 'v2': 10}, {'v0': -6, 'v1': 11, 'v2': -8}, {'v0': 7, 'v1': 0, 'v2': 9}, {'v0': -1, 'v1': -2, 'v2': 14}, {'v0': 7, 'v1': 9, 'v2': 9}, {'v0': 7, 'v1': 4, 'v2': 12}],
+    'random4': [{'v0': -1, 'v1': 1, 'v2': -5}, {'v0': 15, 'v1': 4, 'v2': 7}, {'v0': -4, 'v1': -6, 'v2': -6}, {'v0': -8, 'v1': 4, 'v2': 9}, {'v0': 1, 'v1': -7, 'v2': -1}, {'v0': 8, 'v1': 9, 'v2': 3}, {'v0': 0, 'v1': -3, 'v2': -5}, {'v0': 0, 'v1': -2, 'v2': -8}],
+    'random5': [{'v0': 11, 'v1': 0, 'v2': 15}, {'v0': 3, 'v1': 14, 'v2': 15}, {'v0': 12, 'v1': 8, 'v2': -8}, {'v0': 6, 'v1': -1, 'v2': 12}, {'v0': -7, 'v1': -3, 'v2': -5}, {'v0': 3, 'v1': 7, 'v2': -1}, {'v0': 4, 'v1': 9, 'v2': -5}, {'v0': 10, 'v1': -1, 'v2': -8}],
+    'random6': [{'v0': 10, 'v1': -6, 'v2': 7}, {'v0': 0, 'v1': -7, 'v2': -8}, {'v0': -4, 'v1': 13, 'v2': 10}, {'v0': 7, 'v1': 15, 'v2': 3}, {'v0': 2, 'v1': -8, 'v2': 0}, {'v0': 7, 'v1': -2, 'v2': 15}, {'v0': 5, 'v1': 9, 'v2': 9}, {'v0': 13, 'v1': -5, 'v2': -2}],
+    'random7': [{'v0': 2, 'v1': -4, 'v2': 4}, {'v0': 12, 'v1': -7, 'v2': -6}, {'v0': 9, 'v1': -5, 'v2': 3}, {'v0': 10, 'v1': -7, 'v2': 8}, {'v0': -2, 'v1': -7, 'v2': -6}, {'v0': 5, 'v1': 5, 'v2': -6}, {'v0': -1, 'v1': -6, 'v2': 9}, {'v0': 5, 'v1': -7, 'v2': 10}],
+    'random8': [{'v0': -1, 'v1': 3, 'v2': 4}, {'v0': -4, 'v1': -2, 'v2': 14}, {'v0': -7, 'v1': -6, 'v2': -4}, {'v0': -1, 'v1': 8, 'v2': -2}, {'v0': 4, 'v1': 12, 'v2': -8}, {'v0': 6, 'v1': 7, 'v2': 6}, {'v0': 4, 'v1': 7, 'v2': 10}, {'v0': -2, 'v1': 4, 'v2': -6}],
+    'random9': [{'v0': 6, 'v1': 11, 'v2': 3}, {'v0': 0, 'v1': -4, 'v2': -3}, {'v0': 13, 'v1': -8, 'v2': 2}, {'v0': 8, 'v1': 6, 'v2': 11}, {'v0': -6, 'v1': 2, 'v2': 9}, {'v0': 11, 'v1': 14, 'v2': -7}, {'v0': 15, 'v1': 4, 'v2': -3}, {'v0': 14, 'v1': 6, 'v2': 15}],
+    'random10': [{'v0': 10, 'v1': -7, 'v2': 5}, {'v0': 7, 'v1': 10, 'v2': -8}, {'v0': -2, 'v1': 6, 'v2': 7}, {'v0': 0, 'v1': 12, 'v2': -3}, {'v0': -7, 'v1': 8, 'v2': 7}, {'v0': 2, 'v1': -6, 'v2': -1}, {'v0': 15, 'v1': 3, 'v2': -7}, {'v0': 5, 'v1': -4, 'v2': 11}],
+    'random11': [{'v0': 6, 'v1': 9, 'v2': 6}, {'v0': 6, 'v1': 8, 'v2': 10}, {'v0': -2, 'v1': -3, 'v2': 8}, {'v0': 7, 'v1': 12, 'v2': 11}, {'v0': -3, 'v1': -5, 'v2': 6}, {'v0': 1, 'v1': -4, 'v2': -6}, {'v0': 9, 'v1': 14, 'v2': 12}, {'v0': -7, 'v1': 11, 'v2': 4}],
+    'random12': [{'v0': 7, 'v1': 0, 'v2': 13}, {'v0': 8, 'v1': 13, 'v2': 3}, {'v0': -4, 'v1': 4, 'v2': -8}, {'v0': 3, 'v1': 7, 'v2': 0}, {'v0': 12, 'v1': 6, 'v2': 14}, {'v0': 11, 'v1': -1, 'v2': 9}, {'v0': -8, 'v1': 13, 'v2': 11}, {'v0': -4, 'v1': 6, 'v2': 3}],
+    'random13': [{'v0': 0, 'v1': 1, 'v2': 13}, {'v0': 13, 'v1': -3, 'v2': 12}, {'v0': -1, 'v1': 13, 'v2': -4}, {'v0': -1, 'v1': 12, 'v2': 15}, {'v0': -3, 'v1': -4, 'v2': -6}, {'v0': 9, 'v1': -2, 'v2': 15}, {'v0': 1, 'v1': -8, 'v2': 5}, {'v0': -4, 'v1': 13, 'v2': 11}],
+    'random14': [{'v0': -5, 'v1': 11, 'v2': 14}, {'v0': 12, 'v1': 8, 'v2': -1}, {'v0': 0, 'v1': 15, 'v2': 0}, {'v0': 1, 'v1': 15, 'v2': -6}, {'v0': 13, 'v1': 6, 'v2': 1}, {'v0': 6, 'v1': 13, 'v2': 4}, {'v0': 4, 'v1': -5, 'v2': 0}, {'v0': -1, 'v1': 2, 'v2': 3}],
+    'random15': [{'v0': -2, 'v1': -8, 'v2': 8}, {'v0': 15, 'v1': -7, 'v2': -3}, {'v0': -1, 'v1': -8, 'v2': -7}, {'v0': 13, 'v1': -4, 'v2': 14}, {'v0': 3, 'v1': -1, 'v2': -5}, {'v0': 2, 'v1': 6, 'v2': 14}, {'v0': 3, 'v1': 0, 'v2': 4}, {'v0': 0, 'v1': 3, 'v2': -1}],
+    'random16': [{'v0': 3, 'v1': 7, 'v2': 7}, {'v0': 1, 'v1': 5, 'v2': -1}, {'v0': 6, 'v1': -8, 'v2': 5}, {'v0': 13, 'v1': 14, 'v2': 0}, {'v0': -1, 'v1': 12, 'v2': -1}, {'v0': -8, 'v1': 1, 'v2': 1}, {'v0': 2, 'v1': 13, 'v2': -4}, {'v0': 15, 'v1': 11, 'v2': 1}],
+    'random17': [{'v0': 8, 'v1': 5, 'v2': 1}, {'v0': 3, 'v1': 1, 'v2': -3}, {'v0': 14, 'v1': 14, 'v2': 9}, {'v0': 13, 'v1': 0, 'v2': -5}, {'v0': -8, 'v1': -1, 'v2': 4}, {'v0': 15, 'v1': 5, 'v2': 0}, {'v0': 8, 'v1': 2, 'v2': 12}, {'v0': 13, 'v1': 15, 'v2': 4}],
+    'random18': [{'v0': -3, 'v1': -5, 'v2': 13}, {'v0': 6, 'v1': 2, 'v2': -1}, {'v0': -2, 'v1': 7, 'v2': 12}, {'v0': 7, 'v1': -3, 'v2': 7}, {'v0': 1, 'v1': 6, 'v2': 0}, {'v0': -2, 'v1': 0, 'v2': 14}, {'v0': -5, 'v1': 2, 'v2': 8}, {'v0': 13, 'v1': -3, 'v2': -1}],
+    'random19': [{'v0': 13, 'v1': -7, 'v2': 8}, {'v0': -5, 'v1': 8, 'v2': -2}, {'v0': 4, 'v1': 3, 'v2': 8}, {'v0': 1, 'v1': 10, 'v2': -4}, {'v0': 11, 'v1': 0, 'v2': -5}, {'v0': 0, 'v1': 5, 'v2': 2}, {'v0': 0, 'v1': -5, 'v2': 2}, {'v0': 1, 'v1': -8, 'v2': 10}],
+    'random20': [{'v0': 15, 'v1': 13, 'v2': -4}, {'v0': 0, 'v1': 13, 'v2': 12}, {'v0': -5, 'v1': 2, 'v2': 10}, {'v0': -3, 'v1': -8, 'v2': 5}, {'v0': 5, 'v1': -6, 'v2': -5}, {'v0': -4, 'v1': 2, 'v2': 7}, {'v0': 10, 'v1': 6, 'v2': 5}, {'v0': -2, 'v1': -2, 'v2': 2}],
+    'random21': [{'v0': -3, 'v1': 5, 'v2': 14}, {'v0': 5, 'v1': 12, 'v2': 1}, {'v0': 7, 'v1': -2, 'v2': 7}, {'v0': 8, 'v1': -3, 'v2': 8}, {'v0': 8, 'v1': -1, 'v2': -8}, {'v0': -8, 'v1': 3, 'v2': 10}, {'v0': 5, 'v1': -6, 'v2': -4}, {'v0': -1, 'v1': -1, 'v2': 14}],
+    'random22': [{'v0': -4, 'v1': -1, 'v2': -8}, {'v0': 11, 'v1': 6, 'v2': -3}, {'v0': 14, 'v1': -5, 'v2': 15}, {'v0': 12, 'v1': 3, 'v2': -6}, {'v0': -1, 'v1': 0, 'v2': -7}, {'v0': 2, 'v1': 11, 'v2': -3}, {'v0': 9, 'v1': 13, 'v2': 15}, {'v0': 5, 'v1': 14, 'v2': -7}],
+    'random23': [{'v0': 1, 'v1': -6, 'v2': -8}, {'v0': 10, 'v1': 1, 'v2': 5}, {'v0': 4, 'v1': 8, 'v2': 3}, {'v0': -4, 'v1': 15, 'v2': -2}, {'v0': 0, 'v1': 6, 'v2': -8}, {'v0': -1, 'v1': 11, 'v2': 6}, {'v0': -8, 'v1': -5, 'v2': -6}, {'v0': 14, 'v1': 7, 'v2': 5}],
+    'random24': [{'v0': 14, 'v1': 4, 'v2': 10}, {'v0': -3, 'v1': -2, 'v2': -3}, {'v0': -2, 'v1': -3, 'v2': 13}, {'v0': 13, 'v1': -6, 'v2': 14}, {'v0': -4, 'v1': 14, 'v2': 1}, {'v0': 15, 'v1': -8, 'v2': 6}, {'v0': 6, 'v1': 15, 'v2': 12}, {'v0': -5, 'v1': -8, 'v2': 8}],
+    'random25': [{'v0': 4, 'v1': -8, 'v2': -2}, {'v0': 1, 'v1': 12, 'v2': 7}, {'v0': -7, 'v1': 0, 'v2': -7}, {'v0': 1, 'v1': 10, 'v2': 5}, {'v0': -5, 'v1': 10, 'v2': -5}, {'v0': 10, 'v1': 13, 'v2': 15}, {'v0': -2, 'v1': 8, 'v2': 11}, {'v0': 2, 'v1': -3, 'v2': 9}],
+    'random26': [{'v0': 15, 'v1': -2, 'v2': 13}, {'v0': -2, 'v1': 5, 'v2': 11}, {'v0': 9, 'v1': -7, 'v2': -4}, {'v0': 7, 'v1': -7, 'v2': 15}, {'v0': 13, 'v1': 11, 'v2': 8}, {'v0': -3, 'v1': 12, 'v2': 5}, {'v0': -1, 'v1': 15, 'v2': 5}, {'v0': 14, 'v1': -2, 'v2': 14}],
+    'random27': [{'v0': 12, 'v1': 7, 'v2': 14}, {'v0': 0, 'v1': 1, 'v2': -2}, {'v0': -6, 'v1': -6, 'v2': 0}, {'v0': 9, 'v1': 2, 'v2': 0}, {'v0': 3, 'v1': 4, 'v2': -3}, {'v0': -1, 'v1': -1, 'v2': 7}, {'v0': -6, 'v1': 15, 'v2': 12}, {'v0': 10, 'v1': 12, 'v2': -6}],
+    'random28': [{'v0': -5, 'v1': 15, 'v2': -4}, {'v0': 9, 'v1': 11, 'v2': 14}, {'v0': -3, 'v1': -1, 'v2': -4}, {'v0': 12, 'v1': 6, 'v2': 5}, {'v0': -2, 'v1': -2, 'v2': -4}, {'v0': 4, 'v1': -3, 'v2': -4}, {'v0': 11, 'v1': -2, 'v2': -2}, {'v0': -8, 'v1': 5, 'v2': -1}],
+    'random29': [{'v0': 9, 'v1': -6, 'v2': 3}, {'v0': 11, 'v1': 11, 'v2': 1}, {'v0': -6, 'v1': 8, 'v2': 3}, {'v0': 4, 'v1': 5, 'v2': -8}, {'v0': -7, 'v1': -5, 'v2': 6}, {'v0': 12, 'v1': -1, 'v2': 3}, {'v0': -6, 'v1': 7, 'v2': 2}, {'v0': 11, 'v1': 9, 'v2': 5}],
+    'random30': [{'v0': 9, 'v1': 1, 'v2': 11}, {'v0': -8, 'v1': 11, 'v2': 12}, {'v0': -2, 'v1': 0, 'v2': -7}, {'v0': 4, 'v1': 4, 'v2': 12}, {'v0': -4, 'v1': -6, 'v2': 6}, {'v0': -8, 'v1': 8, 'v2': -1}, {'v0': -8, 'v1': -6, 'v2': -3}, {'v0': 11, 'v1': 8, 'v2': 4}],
+    'random31': [{'v0': -8, 'v1': 7, 'v2': -5}, {'v0': 4, 'v1': -4, 'v2': 13}, {'v0': -7, 'v1': -4, 'v2': -5}, {'v0': 9, 'v1': -1, 'v2': 14}, {'v0': -4, 'v1': -4, 'v2': 15}, {'v0': -7, 'v1': 13, 'v2': -7}, {'v0': -4, 'v1': -1, 'v2': 9}, {'v0': 15, 'v1': 6, 'v2': 8}],
+    'random32': [{'v0': -6, 'v1': -2, 'v2': -4}, {'v0': 1, 'v1': 14, 'v2': -1}, {'v0': 7, 'v1': -8, 'v2': 15}, {'v0': -7, 'v1': -5, 'v2': 2}, {'v0': 8, 'v1': 2, 'v2': -7}, {'v0': 8, 'v1': 14, 'v2': 7}, {'v0': 3, 'v1': 11, 'v2': -8}, {'v0': 9, 'v1': -4, 'v2': 8}],
+    'random33': [{'v0': 10, 'v1': -3, 'v2': 12}, {'v0': -1, 'v1': 0, 'v2': 7}, {'v0': 12, 'v1': 9, 'v2': 8}, {'v0': -3, 'v1': 12, 'v2': 11}, {'v0': 8, 'v1': 2, 'v2': 13}, {'v0': 8, 'v1': 7, 'v2': 6}, {'v0': 1, 'v1': 13, 'v2': 12}, {'v0': -6, 'v1': 1, 'v2': 5}],
+    'random34': [{'v0': 8, 'v1': 3, 'v2': 10}, {'v0': -8, 'v1': -1, 'v2': -8}, {'v0': 4, 'v1': 3, 'v2': -6}, {'v0': 5, 'v1': 1, 'v2': 2}, {'v0': -5, 'v1': 10, 'v2': 8}, {'v0': -4, 'v1': -5, 'v2': 0}, {'v0': 3, 'v1': 11, 'v2': -8}, {'v0': -4, 'v1': 8, 'v2': -6}],
+    'random35': [{'v0': 9, 'v1': 2, 'v2': -4}, {'v0': 15, 'v1': 2, 'v2': -4}, {'v0': 1, 'v1': 5, 'v2': 0}, {'v0': 10, 'v1': -7, 'v2': 15}, {'v0': 8, 'v1': 0, 'v2': 12}, {'v0': 3, 'v1': 14, 'v2': 10}, {'v0': -5, 'v1': 3, 'v2': -8}, {'v0': 8, 'v1': -8, 'v2': -5}],
+    'random36': [{'v0': 2, 'v1': -7, 'v2': -8}, {'v0': 1, 'v1': -6, 'v2': -8}, {'v0': 8, 'v1': 12, 'v2': -3}, {'v0': -1, 'v1': 0, 'v2': 15}, {'v0': 12, 'v1': 5, 'v2': 3}, {'v0': 9, 'v1': 0, 'v2': 9}, {'v0': -6, 'v1': 10, 'v2': 5}, {'v0': 7, 'v1': 4, 'v2': 3}],
+    'random37': [{'v0': 13, 'v1': 11, 'v2': -6}, {'v0': 11, 'v1': 13, 'v2': 15}, {'v0': 12, 'v1': 8, 'v2': -7}, {'v0': 12, 'v1': 3, 'v2': 6}, {'v0': 8, 'v1': -5, 'v2': 13}, {'v0': 6, 'v1': 11, 'v2': 1}, {'v0': 4, 'v1': 15, 'v2': 5}, {'v0': 6, 'v1': -4, 'v2': -7}],
+    'random38': [{'v0': 12, 'v1': 5, 'v2': 5}, {'v0': 15, 'v1': -5, 'v2': -6}, {'v0': 3, 'v1': 14, 'v2': 6}, {'v0': 3, 'v1': -7, 'v2': 11}, {'v0': 13, 'v1': -3, 'v2': 10}, {'v0': 3, 'v1': 2, 'v2': 0}, {'v0': 14, 'v1': 2, 'v2': 11}, {'v0': 15, 'v1': 1, 'v2': 7}],
+    'random39': [{'v0': -2, 'v1': 0, 'v2': 4}, {'v0': -8, 'v1': -2, 'v2': -1}, {'v0': 4, 'v1': 15, 'v2': 10}, {'v0': -8, 'v1': 12, 'v2': 0}, {'v0': 13, 'v1': 3, 'v2': 14}, {'v0': -3, 'v1': -8, 'v2': 1}, {'v0': 13, 'v1': -6, 'v2': 3}, {'v0': -8, 'v1': -5, 'v2': 5}],
+    'random40': [{'v0': 6, 'v1': 10, 'v2': 8}, {'v0': -7, 'v1': -1, 'v2': 1}, {'v0': 13, 'v1': 12, 'v2': 13}, {'v0': -2, 'v1': -4, 'v2': 3}, {'v0': 0, 'v1': 15, 'v2': 6}, {'v0': -8, 'v1': 8, 'v2': 15}, {'v0': -4, 'v1': -7, 'v2': 12}, {'v0': -2, 'v1': 11, 'v2': 14}],
+    'random41': [{'v0': 4, 'v1': 2, 'v2': -1}, {'v0': -3, 'v1': 4, 'v2': 10}, {'v0': 14, 'v1': 1, 'v2': 9}, {'v0': 0, 'v1': 4, 'v2': 15}, {'v0': 10, 'v1': -8, 'v2': -1}, {'v0': 13, 'v1': -8, 'v2': 6}, {'v0': -4, 'v1': -4, 'v2': 15}, {'v0': 2, 'v1': -3, 'v2': 0}],
+    'random42': [{'v0': 12, 'v1': -5, 'v2': -8}, {'v0': 15, 'v1': 0, 'v2': -1}, {'v0': -1, 'v1': -4, 'v2': 15}, {'v0': -5, 'v1': 13, 'v2': 15}, {'v0': 9, 'v1': -6, 'v2': 10}, {'v0': 5, 'v1': -7, 'v2': -8}, {'v0': -6, 'v1': -2, 'v2': -1}, {'v0': 8, 'v1': 11, 'v2': -8}],
+    'random43': [{'v0': -7, 'v1': 1, 'v2': 14}, {'v0': -4, 'v1': 6, 'v2': 3}, {'v0': 13, 'v1': 14, 'v2': -5}, {'v0': 6, 'v1': 11, 'v2': 7}, {'v0': 11, 'v1': -8, 'v2': 8}, {'v0': 5, 'v1': 10, 'v2': 3}, {'v0': 11, 'v1': 9, 'v2': 5}, {'v0': 4, 'v1': -3, 'v2': -7}],
+    'random44': [{'v0': 5, 'v1': 8, 'v2': 9}, {'v0': 14, 'v1': -5, 'v2': -3}, {'v0': 4, 'v1': -1, 'v2': 1}, {'v0': -8, 'v1': -1, 'v2': -5}, {'v0': 10, 'v1': -8, 'v2': -5}, {'v0': -3, 'v1': 8, 'v2': 14}, {'v0': 1, 'v1': 14, 'v2': 12}, {'v0': 4, 'v1': 10, 'v2': 4}],
+    'random45': [{'v0': 0, 'v1': 5, 'v2': 7}, {'v0': 0, 'v1': -6, 'v2': 1}, {'v0': 2, 'v1': -8, 'v2': -6}, {'v0': 7, 'v1': -8, 'v2': -5}, {'v0': 1, 'v1': -5, 'v2': 1}, {'v0': 15, 'v1': 12, 'v2': -7}, {'v0': 11, 'v1': -6, 'v2': -4}, {'v0': 0, 'v1': 15, 'v2': -4}],
+    'random46': [{'v0': -6, 'v1': 4, 'v2': -7}, {'v0': 10, 'v1': 10, 'v2': -1}, {'v0': 12, 'v1': 8, 'v2': -4}, {'v0': 10, 'v1': 9, 'v2': -7}, {'v0': -8, 'v1': -6, 'v2': 2}, {'v0': 12, 'v1': -7, 'v2': -8}, {'v0': -4, 'v1': 9, 'v2': 1}, {'v0': 8, 'v1': 2, 'v2': 14}],
+    'random47': [{'v0': 3, 'v1': -6, 'v2': 5}, {'v0': 9, 'v1': 6, 'v2': 10}, {'v0': 2, 'v1': 0, 'v2': 8}, {'v0': 4, 'v1': 4, 'v2': 11}, {'v0': -7, 'v1': 5, 'v2': 13}, {'v0': -8, 'v1': -5, 'v2': -8}, {'v0': 0, 'v1': 7, 'v2': 15}, {'v0': 9, 'v1': -8, 'v2': 2}],
+    'random48': [{'v0': 9, 'v1': 2, 'v2': -4}, {'v0': 9, 'v1': 14, 'v2': 9}, {'v0': 1, 'v1': 8, 'v2': -2}, {'v0': 14, 'v1': 5, 'v2': -3}, {'v0': -4, 'v1': 13, 'v2': -5}, {'v0': 7, 'v1': 12, 'v2': -1}, {'v0': -2, 'v1': 8, 'v2': 9}, {'v0': 8, 'v1': -4, 'v2': 7}],
+    'random49': [{'v0': -6, 'v1': 3, 'v2': 5}, {'v0': -5, 'v1': 2, 'v2': 9}, {'v0': 8, 'v1': -7, 'v2': 13}, {'v0': -7, 'v1': 15, 'v2': 0}, {'v0': -4, 'v1': 6, 'v2': 15}, {'v0': -7, 'v1': 12, 'v2': 9}, {'v0': 8, 'v1': -1, 'v2': 11}, {'v0': 1, 'v1': 10, 'v2': 3}],
+}
+
+expected_results = {
+    'mult': [{'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 0}, {'x': 0, 'y': 2, 'z': 0}, {'x': 0, 'y': 3, 'z': 0}, {'x': 0, 'y': 4, 'z': 0}, {'x': 0, 'y': 5, 'z': 0}, {'x': 0, 'y': 6, 'z': 0}, {'x': 0, 'y': 7, 'z': 0}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 1}, {'x': 0, 'y': 2, 'z': 2}, {'x': 0, 'y': 3, 'z': 3}, {'x': 0, 'y': 4, 'z': 4}, {'x': 0, 'y': 5, 'z': 5}, {'x': 0, 'y': 6, 'z': 6}, {'x': 0, 'y': 7, 'z': 7}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 2}, {'x': 0, 'y': 2, 'z': 4}, {'x': 0, 'y': 3, 'z': 6}, {'x': 0, 'y': 4, 'z': 8}, {'x': 0, 'y': 5, 'z': 10}, {'x': 0, 'y': 6, 'z': 12}, {'x': 0, 'y': 7, 'z': 14}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 3}, {'x': 0, 'y': 2, 'z': 6}, {'x': 0, 'y': 3, 'z': 9}, {'x': 0, 'y': 4, 'z': 12}, {'x': 0, 'y': 5, 'z': 15}, {'x': 0, 'y': 6, 'z': 18}, {'x': 0, 'y': 7, 'z': 21}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 4}, {'x': 0, 'y': 2, 'z': 8}, {'x': 0, 'y': 3, 'z': 12}, {'x': 0, 'y': 4, 'z': 16}, {'x': 0, 'y': 5, 'z': 20}, {'x': 0, 'y': 6, 'z': 24}, {'x': 0, 'y': 7, 'z': 28}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 5}, {'x': 0, 'y': 2, 'z': 10}, {'x': 0, 'y': 3, 'z': 15}, {'x': 0, 'y': 4, 'z': 20}, {'x': 0, 'y': 5, 'z': 25}, {'x': 0, 'y': 6, 'z': 30}, {'x': 0, 'y': 7, 'z': 35}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 6}, {'x': 0, 'y': 2, 'z': 12}, {'x': 0, 'y': 3, 'z': 18}, {'x': 0, 'y': 4, 'z': 24}, {'x': 0, 'y': 5, 'z': 30}, {'x': 0, 'y': 6, 'z': 36}, {'x': 0, 'y': 7, 'z': 42}, {'x': 0, 'y': 0, 'z': 0}, {'x': 0, 'y': 1, 'z': 7}, {'x': 0, 'y': 2, 'z': 14}, {'x': 0, 'y': 3, 'z': 21}, {'x': 0, 'y': 4, 'z': 28}, {'x': 0, 'y': 5, 'z': 35}, {'x': 0, 'y': 6, 'z': 42}, {'x': 0, 'y': 7, 'z': 49}],
+    'fac': [{'x': 0, 'y': 1}, {'x': 0, 'y': 1}, {'x': 0, 'y': 2}, {'x': 0, 'y': 6}, {'x': 0, 'y': 24}, {'x': 0, 'y': 120}, {'x': 0, 'y': 720}, {'x': 0, 'y': 5040}, {'x': 0, 'y': 40320}, {'x': 0, 'y': 362880}, {'x': 0, 'y': 3628800}, {'x': 0, 'y': 39916800}, {'x': 0, 'y': 479001600}, {'x': 0, 'y': 6227020800}, {'x': 0, 'y': 87178291200}, {'x': 0, 'y': 1307674368000}],
+    'prime_checker': [{'x': 2, 'z': 1, 'c': 2}, {'x': 3, 'z': 1, 'c': 3, 'b': 1}, {'x': 4, 'z': 0, 'c': 4, 'b': 1}, {'x': 5, 'z': 1, 'c': 5, 'b': 1}, {'x': 6, 'z': 0, 'c': 6, 'b': 1}, {'x': 7, 'z': 1, 'c': 7, 'b': 1}, {'x': 8, 'z': 0, 'c': 8, 'b': 1}, {'x': 9, 'z': 0, 'c': 9, 'b': 1}, {'x': 10, 'z': 0, 'c': 10, 'b': 1}, {'x': 11, 'z': 1, 'c': 11, 'b': 1}, {'x': 12, 'z': 0, 'c': 12, 'b': 1}, {'x': 13, 'z': 1, 'c': 13, 'b': 1}, {'x': 14, 'z': 0, 'c': 14, 'b': 1}, {'x': 15, 'z': 0, 'c': 15, 'b': 1}, {'x': 16, 'z': 0, 'c': 16, 'b': 1}, {'x': 17, 'z': 1, 'c': 17, 'b': 1}, {'x': 18, 'z': 0, 'c': 18, 'b': 1}, {'x': 19, 'z': 1, 'c': 19, 'b': 1}, {'x': 20, 'z': 0, 'c': 20, 'b': 1}, {'x': 21, 'z': 0, 'c': 21, 'b': 1}, {'x': 22, 'z': 0, 'c': 22, 'b': 1}, {'x': 23, 'z': 1, 'c': 23, 'b': 1}, {'x': 24, 'z': 0, 'c': 24, 'b': 1}, {'x': 25, 'z': 0, 'c': 25, 'b': 1}, {'x': 26, 'z': 0, 'c': 26, 'b': 1}, {'x': 27, 'z': 0, 'c': 27, 'b': 1}, {'x': 28, 'z': 0, 'c': 28, 'b': 1}, {'x': 29, 'z': 1, 'c': 29, 'b': 1}, {'x': 30, 'z': 0, 'c': 30, 'b': 1}, {'x': 31, 'z': 1, 'c': 31, 'b': 1}, {'x': 32, 'z': 0, 'c': 32, 'b': 1}, {'x': 33, 'z': 0, 'c': 33, 'b': 1}, {'x': 34, 'z': 0, 'c': 34, 'b': 1}, {'x': 35, 'z': 0, 'c': 35, 'b': 1}, {'x': 36, 'z': 0, 'c': 36, 'b': 1}, {'x': 37, 'z': 1, 'c': 37, 'b': 1}, {'x': 38, 'z': 0, 'c': 38, 'b': 1}, {'x': 39, 'z': 0, 'c': 39, 'b': 1}, {'x': 40, 'z': 0, 'c': 40, 'b': 1}, {'x': 41, 'z': 1, 'c': 41, 'b': 1}, {'x': 42, 'z': 0, 'c': 42, 'b': 1}, {'x': 43, 'z': 1, 'c': 43, 'b': 1}, {'x': 44, 'z': 0, 'c': 44, 'b': 1}, {'x': 45, 'z': 0, 'c': 45, 'b': 1}, {'x': 46, 'z': 0, 'c': 46, 'b': 1}, {'x': 47, 'z': 1, 'c': 47, 'b': 1}, {'x': 48, 'z': 0, 'c': 48, 'b': 1}, {'x': 49, 'z': 0, 'c': 49, 'b': 1}, {'x': 50, 'z': 0, 'c': 50, 'b': 1}, {'x': 51, 'z': 0, 'c': 51, 'b': 1}, {'x': 52, 'z': 0, 'c': 52, 'b': 1}, {'x': 53, 'z': 1, 'c': 53, 'b': 1}, {'x': 54, 'z': 0, 'c': 54, 'b': 1}, {'x': 55, 'z': 0, 'c': 55, 'b': 1}, {'x': 56, 'z': 0, 'c': 56, 'b': 1}, {'x': 57, 'z': 0, 'c': 57, 'b': 1}, {'x': 58, 'z': 0, 'c': 58, 'b': 1}, {'x': 59, 'z': 1, 'c': 59, 'b': 1}, {'x': 60, 'z': 0, 'c': 60, 'b': 1}, {'x': 61, 'z': 1, 'c': 61, 'b': 1}, {'x': 62, 'z': 0, 'c': 62, 'b': 1}, {'x': 63, 'z': 0, 'c': 63, 'b': 1}],
+    'random0': [{'v0': 4, 'v1': 1, 'v2': 4}, {'v0': 0, 'v1': 1, 'v2': 0}, {'v0': 0, 'v1': 1, 'v2': 0}, {'v0': 3, 'v1': 1, 'v2': 3}, {'v0': 1, 'v1': 8, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 8, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 0}, {'v0': 1, 'v1': 8, 'v2': 1, 'i0': 0}],
+    'random1': [{'v0': 1, 'v1': 1, 'v2': 1, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': -5}, {'v0': 6, 'v1': 0, 'v2': 6}, {'v0': 4, 'v1': 1, 'v2': -2}, {'v0': 7, 'v1': 0, 'v2': -8}, {'v0': 5, 'v1': 0, 'v2': 10}, {'v0': 14, 'v1': 0, 'v2': 5}, {'v0': 15, 'v1': 1, 'v2': -1}],
+    'random2': [{'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 1, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 0}],
+    'random3': [{'v0': 2, 'v1': 1, 'v2': 1}, {'v0': 2, 'v1': 1, 'v2': 1}, {'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 2, 'v1': 1, 'v2': 1}, {'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 2, 'v1': 1, 'v2': 1}, {'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 2, 'v1': 1, 'v2': 0}],
+    'random4': [{'v0': 0, 'v1': -10, 'v2': 0}, {'v0': 0, 'v1': 7, 'v2': 7}, {'v0': 0, 'v1': -12, 'v2': 0}, {'v0': 0, 'v1': 9, 'v2': 9}, {'v0': 0, 'v1': -2, 'v2': 0}, {'v0': 0, 'v1': 3, 'v2': 3}, {'v0': 0, 'v1': -10, 'v2': 0}, {'v0': 0, 'v1': -16, 'v2': 0}],
+    'random5': [{'v0': 11, 'v1': 0, 'v2': 15, 'i0': 0, 'i1': 1}, {'v0': 3, 'v1': 14, 'v2': 15, 'i0': 0, 'i1': 1}, {'v0': 12, 'v1': 8, 'v2': -8, 'i0': 0, 'i1': 1}, {'v0': 6, 'v1': -1, 'v2': 12, 'i0': 0, 'i1': 1}, {'v0': -7, 'v1': -3, 'v2': -5, 'i0': 0, 'i1': 1}, {'v0': 3, 'v1': 7, 'v2': -1, 'i0': 0, 'i1': 1}, {'v0': 4, 'v1': 9, 'v2': -5, 'i0': 0, 'i1': 1}, {'v0': 10, 'v1': -1, 'v2': -8, 'i0': 0, 'i1': 1}],
+    'random6': [{'v0': 1, 'v1': -3, 'v2': 7, 'i0': 0, 'i2': 0}, {'v0': 0, 'v1': -1, 'v2': 1, 'i0': 0, 'i1': 0, 'i2': 0}, {'v0': 0, 'v1': 14, 'v2': 10, 'i0': 0, 'i2': 0}, {'v0': 1, 'v1': 18, 'v2': 3, 'i0': 0, 'i2': 0}, {'v0': 2, 'v1': -8, 'v2': 0, 'i0': 3}, {'v0': 1, 'v1': 1, 'v2': 15, 'i0': 0, 'i2': 0}, {'v0': 1, 'v1': 12, 'v2': 9, 'i0': 0, 'i2': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0, 'i2': 0}],
+    'random7': [{'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0}, {'v0': -7, 'v1': -7, 'v2': -6, 'i0': 3}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0}, {'v0': -7, 'v1': -7, 'v2': -6, 'i0': 3}, {'v0': 5, 'v1': 5, 'v2': -6, 'i0': 3}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 2, 'i1': 0}],
+    'random8': [{'v0': -2, 'v1': -2, 'v2': 4}, {'v0': -11, 'v1': -11, 'v2': 14}, {'v0': -20, 'v1': -20, 'v2': -4}, {'v0': -2, 'v1': -2, 'v2': -2}, {'v0': 13, 'v1': 13, 'v2': -8}, {'v0': 19, 'v1': 19, 'v2': 6}, {'v0': 13, 'v1': 13, 'v2': 10}, {'v0': -5, 'v1': -5, 'v2': -6}],
+    'random9': [{'v0': 1, 'v1': 11, 'v2': 1}, {'v0': 0, 'v1': -4, 'v2': 1}, {'v0': 0, 'v1': -8, 'v2': 1}, {'v0': 1, 'v1': 6, 'v2': 1}, {'v0': 1, 'v1': 2, 'v2': 1}, {'v0': 1, 'v1': 14, 'v2': 1}, {'v0': 1, 'v1': 4, 'v2': 1}, {'v0': 1, 'v1': 6, 'v2': 1}],
+    'random10': [{'v0': 1, 'v1': 0, 'v2': 7, 'i0': 1, 'i1': 0, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': -90, 'i0': 1, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': -30, 'i0': 1, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': -132, 'i0': 1, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': -56, 'i0': 1, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': 7, 'i0': 1, 'i1': 0, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': 7, 'i0': 1, 'i1': 3, 'i2': 0}, {'v0': 1, 'v1': 0, 'v2': 7, 'i0': 1, 'i1': 0, 'i2': 0}],
+    'random11': [{'v0': 1, 'v1': 1, 'v2': 6, 'i0': 0}, {'v0': 1, 'v1': 1, 'v2': 10, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 1, 'v1': 1, 'v2': 11, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 1, 'v1': 1, 'v2': 1}, {'v0': 1, 'v1': 1, 'v2': 12, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 4, 'i0': 0}],
+    'random12': [{'v0': 9, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i0': 3, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i0': 3, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i1': 0}, {'v0': 9, 'v1': 1, 'v2': 1, 'i1': 0}],
+    'random13': [{'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}, {'v0': 1, 'v1': 4, 'v2': 1, 'i1': 2}],
+    'random14': [{'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -1, 'i0': 0}],
+    'random15': [{'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}, {'v0': 4, 'v1': 0, 'v2': 0}],
+    'random16': [{'v0': 3, 'v1': 1, 'v2': -4, 'i0': 0}, {'v0': 1, 'v1': 1, 'v2': -1}, {'v0': 6, 'v1': 1, 'v2': -4, 'i0': 0}, {'v0': 13, 'v1': 1, 'v2': -4, 'i0': 0}, {'v0': -1, 'v1': 1, 'v2': -1}, {'v0': -8, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 2, 'v1': 1, 'v2': -4}, {'v0': 15, 'v1': 1, 'v2': -4, 'i0': 0}],
+    'random17': [{'v0': 8, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': 3, 'v1': 7, 'v2': 0, 'i0': 0}, {'v0': 14, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': 13, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': -8, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': 15, 'v1': 7, 'v2': 0, 'i0': 0}, {'v0': 8, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': 13, 'v1': 7, 'v2': 1, 'i0': 0}],
+    'random18': [{'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0}],
+    'random19': [{'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 3, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 0, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 0, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 0, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 3, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 0, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 3, 'i4': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i3': 3, 'i4': 0}],
+    'random20': [{'v0': 6, 'v1': 6, 'v2': 6}, {'v0': 6, 'v1': 6, 'v2': 6}, {'v0': 9, 'v1': 9, 'v2': 9}, {'v0': 14, 'v1': 14, 'v2': 9}, {'v0': 2, 'v1': 2, 'v2': 9}, {'v0': 6, 'v1': 6, 'v2': 9}, {'v0': 6, 'v1': 6, 'v2': 6}, {'v0': 5, 'v1': 5, 'v2': 9}],
+    'random21': [{'v0': -3, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': 5, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': 7, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': 8, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': 8, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': -8, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': 5, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}, {'v0': -1, 'v1': 0, 'v2': 0, 'i0': 3, 'i2': 1}],
+    'random22': [{'v0': 2, 'v1': -1, 'v2': 1}, {'v0': 2, 'v1': 6, 'v2': 1}, {'v0': 2, 'v1': -5, 'v2': 1}, {'v0': 2, 'v1': 3, 'v2': 1}, {'v0': 2, 'v1': 0, 'v2': 1}, {'v0': 2, 'v1': 11, 'v2': 1}, {'v0': 2, 'v1': 13, 'v2': 1}, {'v0': 2, 'v1': 14, 'v2': 1}],
+    'random23': [{'v0': 6, 'v1': 3, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 5, 'v1': 3, 'v2': 5, 'i0': 2, 'i2': 1}, {'v0': 8, 'v1': 3, 'v2': 0, 'i0': 2}, {'v0': 15, 'v1': 3, 'v2': 0, 'i0': 2}, {'v0': 6, 'v1': 3, 'v2': 0, 'i0': 2}, {'v0': 11, 'v1': 3, 'v2': 0, 'i0': 2}, {'v0': 6, 'v1': 3, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': 7, 'v1': 3, 'v2': 0, 'i0': 2}],
+    'random24': [{'v0': 2, 'v1': 4, 'v2': 0}, {'v0': -3, 'v1': 2, 'v2': -3, 'i0': 0}, {'v0': -27, 'v1': -3, 'v2': 0}, {'v0': -2, 'v1': -6, 'v2': 0}, {'v0': -4, 'v1': -14, 'v2': 1, 'i0': 1}, {'v0': -2, 'v1': -8, 'v2': 0}, {'v0': 0, 'v1': 15, 'v2': 0}, {'v0': -5, 'v1': 8, 'v2': 8, 'i0': 0}],
+    'random25': [{'v0': -10, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': -1, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': -15, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': -3, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': -13, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': 7, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}, {'v0': 1, 'v1': 9, 'v2': 4, 'i0': 0, 'i1': 1, 'i2': 0, 'i3': 0}],
+    'random26': [{'v0': -1, 'v1': 15, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 0, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 9, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 7, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 13, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 0, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 0, 'v2': 1, 'i0': 1}, {'v0': -1, 'v1': 14, 'v2': 1, 'i0': 1}],
+    'random27': [{'v0': 2, 'v1': 7, 'v2': 1, 'i0': 0}, {'v0': 2, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': -6, 'v2': 0, 'i0': 0}, {'v0': 2, 'v1': 2, 'v2': 1, 'i0': 0}, {'v0': 2, 'v1': 4, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': -1, 'v2': 0, 'i0': 0}, {'v0': 2, 'v1': 15, 'v2': 1, 'i0': 0}, {'v0': 2, 'v1': 12, 'v2': 1, 'i0': 0}],
+    'random28': [{'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}, {'v0': 5, 'v1': 0, 'v2': 5}],
+    'random29': [{'v0': 9, 'v1': -6, 'v2': 3, 'i0': 2, 'i1': 0}, {'v0': 11, 'v1': 11, 'v2': 1, 'i0': 2, 'i1': 0}, {'v0': -6, 'v1': 8, 'v2': 3, 'i0': 2, 'i1': 0}, {'v0': 4, 'v1': 5, 'v2': -8, 'i0': 2, 'i1': 0}, {'v0': -7, 'v1': -5, 'v2': 6, 'i0': 2, 'i1': 0}, {'v0': 12, 'v1': 1, 'v2': 0, 'i0': 0, 'i1': 0}, {'v0': -6, 'v1': 7, 'v2': 2, 'i0': 2, 'i1': 0}, {'v0': 11, 'v1': 9, 'v2': 5, 'i0': 2, 'i1': 0}],
+    'random30': [{'v0': 9, 'v1': 1, 'v2': 11, 'i0': 0}, {'v0': -8, 'v1': 1, 'v2': 12, 'i0': 0}, {'v0': -2, 'v1': 1, 'v2': -7, 'i0': 0}, {'v0': 4, 'v1': 1, 'v2': 12, 'i0': 0}, {'v0': -4, 'v1': 1, 'v2': 6, 'i0': 0}, {'v0': -8, 'v1': 1, 'v2': -1, 'i0': 0}, {'v0': -8, 'v1': 1, 'v2': -3, 'i0': 0}, {'v0': 11, 'v1': 1, 'v2': 4, 'i0': 0}],
+    'random31': [{'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 0, 'v1': 13, 'v2': 0}, {'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 0, 'v1': 14, 'v2': 0}, {'v0': 0, 'v1': 15, 'v2': 0}, {'v0': 2, 'v1': 1, 'v2': 0}, {'v0': 0, 'v1': 9, 'v2': 0}, {'v0': 0, 'v1': 8, 'v2': 0}],
+    'random32': [{'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}],
+    'random33': [{'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 0, 'i1': 3}],
+    'random34': [{'v0': 0, 'v1': 3, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': -1, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': 3, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': 1, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': 10, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': -5, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': 11, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}, {'v0': 0, 'v1': 8, 'v2': 60, 'i0': 0, 'i4': 0, 'i5': 0}],
+    'random35': [{'v0': 0, 'v1': 2, 'v2': 2, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 2, 'v2': 2, 'i0': 0, 'i1': 0}, {'v0': 0, 'v1': 5, 'v2': 5, 'i0': 0, 'i1': 1}, {'v0': 0, 'v1': -7, 'v2': -7, 'i0': 0, 'i1': 0, 'i2': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 0}, {'v0': 0, 'v1': 14, 'v2': 14, 'i0': 0, 'i1': 1}, {'v0': 0, 'v1': 3, 'v2': 3, 'i0': 0, 'i1': 1}, {'v0': 0, 'v1': -8, 'v2': -8, 'i0': 0, 'i1': 0, 'i2': 0}],
+    'random36': [{'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}, {'v0': 1, 'v1': 6, 'v2': 1, 'i0': 0}],
+    'random37': [{'v0': 0, 'v1': 11, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': 13, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': 8, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': 3, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': -5, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 0, 'i4': 0}, {'v0': 0, 'v1': 11, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': 15, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 1}, {'v0': 0, 'v1': -4, 'v2': 0, 'i0': 0, 'i1': 0, 'i2': 1, 'i3': 0, 'i4': 0}],
+    'random38': [{'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}, {'v0': 3, 'v1': 4, 'v2': -1, 'i2': 0, 'i3': 0}],
+    'random39': [{'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 8, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}, {'v0': 7, 'v1': 0, 'v2': 1, 'i0': 0, 'i1': 1, 'i2': 0}],
+    'random40': [{'v0': 0, 'v1': 10, 'v2': 144, 'i0': 1}, {'v0': 1, 'v1': -1, 'v2': 0}, {'v0': 0, 'v1': 12, 'v2': 325, 'i0': 1}, {'v0': 1, 'v1': -4, 'v2': -3}, {'v0': 0, 'v1': 15, 'v2': 126}, {'v0': 0, 'v1': 8, 'v2': 345}, {'v0': 1, 'v1': -7, 'v2': 60}, {'v0': 0, 'v1': 11, 'v2': 350}],
+    'random41': [{'v0': 2, 'v1': 2, 'v2': 1, 'i0': 0}, {'v0': 4, 'v1': 4, 'v2': 0, 'i0': 0}, {'v0': 1, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': -8, 'v1': -8, 'v2': 1, 'i0': 0}, {'v0': -8, 'v1': -8, 'v2': 1, 'i0': 0}, {'v0': -4, 'v1': -4, 'v2': 1, 'i0': 0}, {'v0': -3, 'v1': -3, 'v2': 1, 'i0': 0}],
+    'random42': [{'v0': -1, 'v1': -5, 'v2': -5, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': -1, 'v1': -4, 'v2': -4, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': 0, 'v1': 13, 'v2': 13, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': -1, 'v1': -6, 'v2': -6, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': -1, 'v1': -7, 'v2': -7, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': -1, 'v1': -2, 'v2': -2, 'i0': 0, 'i1': 2, 'i2': 0}, {'v0': 0, 'v1': 11, 'v2': 11, 'i0': 0, 'i1': 2, 'i2': 0}],
+    'random43': [{'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 0, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}, {'v0': 0, 'v1': 1, 'v2': 1, 'i0': 0}],
+    'random44': [{'v0': 5, 'v1': 1, 'v2': 1, 'i0': 3}, {'v0': 1, 'v1': 1, 'v2': -5, 'i0': 3}, {'v0': 0, 'v1': 1, 'v2': -4, 'i0': 3}, {'v0': -8, 'v1': 1, 'v2': 0, 'i0': 3}, {'v0': 0, 'v1': 1, 'v2': -6, 'i0': 3}, {'v0': 0, 'v1': 1, 'v2': -7, 'i0': 3}, {'v0': 1, 'v1': 1, 'v2': 1, 'i0': 3}, {'v0': 4, 'v1': 1, 'v2': 1, 'i0': 3}],
+    'random45': [{'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}, {'v0': 0, 'v1': 0, 'v2': -8, 'i0': 0}],
+    'random46': [{'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}, {'v0': 0, 'v1': 5, 'v2': -2, 'i0': 2}],
+    'random47': [{'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}, {'v0': 0, 'v1': 0, 'v2': 1}],
+    'random48': [{'v0': 1, 'v1': 0, 'v2': 0, 'i0': 3}, {'v0': 9, 'v1': 9, 'v2': 9, 'i0': 3, 'i2': 0, 'i3': 0}, {'v0': 1, 'v1': 0, 'v2': 0, 'i0': 3}, {'v0': 1, 'v1': 0, 'v2': 0, 'i0': 3}, {'v0': -4, 'v1': -5, 'v2': -5, 'i0': 3, 'i2': 0, 'i3': 0}, {'v0': 1, 'v1': 0, 'v2': 0, 'i0': 3}, {'v0': 1, 'v1': 0, 'v2': 0, 'i0': 3}, {'v0': 8, 'v1': 7, 'v2': 7, 'i0': 3, 'i2': 0, 'i3': 0}],
+    'random49': [{'v0': -6, 'v1': 8, 'v2': 5, 'i0': 0}, {'v0': -5, 'v1': 8, 'v2': 9, 'i0': 0}, {'v0': 8, 'v1': 8, 'v2': 13, 'i0': 0}, {'v0': -7, 'v1': 8, 'v2': 0, 'i0': 0}, {'v0': -4, 'v1': 8, 'v2': 15, 'i0': 0}, {'v0': -7, 'v1': 8, 'v2': 9, 'i0': 0}, {'v0': 8, 'v1': 8, 'v2': 11, 'i0': 0}, {'v0': 1, 'v1': 8, 'v2': 3, 'i0': 0}],
+}
+
+# diverging between the backends because of atomizer bugs
+expected_failures = ['random1']
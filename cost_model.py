@@ -0,0 +1,476 @@
+import math
+from typing import List, Union, Dict, Optional, Tuple
+
+from compiler import (Program, Instruction, Value, UnaryOp, BinaryOp, AggregateOp, Var, Assign, Copy, Write, If, While,
+                      Add, Sub, Mult, Div, Negate, Sum)
+
+""" static cost model for (atomized) programs
+
+Estimates the number of TM steps and the peak tape length per instruction before the TM is built, using interval
+analysis over Assign/Copy/Write/If/While. Inputs are bounded by their bit widths (x < 2**w), loops by a trip count.
+
+The conditions of atomized loops are temporaries in [0, 1], so the analysis can rarely prove that a loop exits before
+the given trip count. The estimate is then only an upper bound if no loop runs more often than that, which is flagged
+by CostEstimate.assumed_trip_count and checked by validate() against profiled runs.
+
+Cost model (multi-tape TM, binary little endian tapes as in tm_sim.py, w = bit width of the operands):
+- Write / Copy:                 2*(w+1)               (one pass over the tape + rewind)
+- Add / Sub / Negate / compare: 2*(w+1)               (ripple carry / borrow / compare, + rewind)
+- And / Or / Not:               2*(w+1)               (test operands for non-zero, + rewind)
+- Mult:                         w_a * 2*(w_a+w_b+1)   (shift and add)
+- Div:                          w_a * 4*(w_a+1)       (long division: compare and subtract per bit)
+- If / While condition:         1                     (read a single cell)
+
+Peak tape length is the width of the widest tape touched by an instruction, plus the two blank cells that delimit it.
+Unbounded values (wider than max_width bits) are widened to ±inf, which makes the affected costs infinite.
+
+Usage:
+    estimate = CostAnalyzer({x: 4, y: 4}, loop_iterations=15).run(mult.as_atomized)
+    observed = [Profiler().run(mult.as_atomized, {x: i, y: j}) for i in range(16) for j in range(16)]
+    assert not validate(estimate, observed)
+
+"""
+
+
+def _isinf(v) -> bool:
+    # bounds are ints or ±inf, math.isinf would convert (possibly huge) ints to float and overflow
+    return isinstance(v, float) and math.isinf(v)
+
+
+class Interval:
+
+    def __init__(self, lo: Union[int, float], hi: Union[int, float]):
+        self.lo = lo
+        self.hi = hi
+
+    def __repr__(self):
+        return f'[{self.lo}, {self.hi}]'
+
+    def __eq__(self, other):
+        return type(other) is Interval and self.lo == other.lo and self.hi == other.hi
+
+    def __contains__(self, v: int):
+        return self.lo <= v <= self.hi
+
+    @staticmethod
+    def point(v: int) -> 'Interval':
+        return Interval(v, v)
+
+    @property
+    def is_point(self) -> bool:
+        return self.lo == self.hi and not _isinf(self.lo)
+
+    @staticmethod
+    def of_width(w: int) -> 'Interval':
+        return Interval(0, 2**w - 1)
+
+    def join(self, other: 'Interval') -> 'Interval':
+        return Interval(min(self.lo, other.lo), max(self.hi, other.hi))
+
+    def contains_interval(self, other: 'Interval') -> bool:
+        return self.lo <= other.lo and other.hi <= self.hi
+
+    @property
+    def width(self) -> Union[int, float]:
+        # bits needed to store any value of the interval on a tape, plus a sign bit if it can be negative
+        if _isinf(self.lo) or _isinf(self.hi):
+            return math.inf
+        return max(max(abs(self.lo), abs(self.hi)).bit_length(), 1) + (1 if self.lo < 0 else 0)
+
+
+def _add(a, b):
+    # avoids int -> float conversion overflows when adding large bounds to ±inf
+    if _isinf(a):
+        return a
+    if _isinf(b):
+        return b
+    return a + b
+
+def _mul(a, b):
+    if a == 0 or b == 0:
+        return 0
+    if _isinf(a) or _isinf(b):
+        return math.inf if (a > 0) == (b > 0) else -math.inf
+    return a * b
+
+def _neg(a):
+    return -a
+
+
+class IntervalEvaluator:
+
+    def __init__(self, max_width: Optional[int] = 512):
+        self.max_width = max_width
+
+    def clamp(self, i: Interval) -> Interval:
+        if self.max_width is None:
+            return i
+        limit = 2**self.max_width
+        return Interval(-math.inf if i.lo < -limit else i.lo, math.inf if i.hi > limit else i.hi)
+
+    def run(self, v: Union[Value, int], bounds: Dict[Var, Interval]) -> Interval:
+        if type(v) is int:
+            return Interval.point(v)
+        elif type(v) is Var:
+            if v not in bounds:
+                raise RuntimeError(f'No bounds for variable {v}, it is read before it is written')
+            return bounds[v]
+        elif issubclass(type(v), UnaryOp):
+            a = self.run(v.a, bounds)
+            if a.is_point:
+                return Interval.point(int(type(v)(a.lo).evaluate({})))
+            if type(v) is Negate:
+                return Interval(_neg(a.hi), _neg(a.lo))
+            return Interval(0, 1)
+        elif issubclass(type(v), BinaryOp):
+            a, b = self.run(v.a, bounds), self.run(v.b, bounds)
+            if a.is_point and b.is_point:
+                return Interval.point(int(type(v)(a.lo, b.lo).evaluate({})))
+            return self.clamp(self.binary(type(v), a, b))
+        elif issubclass(type(v), AggregateOp):
+            intervals = [self.run(k, bounds) for k in v.a]
+            op = Add if type(v) is Sum else Mult
+            result = Interval(0, 0) if type(v) is Sum else Interval(1, 1)
+            for i in intervals:
+                result = self.clamp(self.binary(op, result, i))
+            return result
+        else:
+            raise NotImplementedError()
+
+    @staticmethod
+    def binary(op: type, a: Interval, b: Interval) -> Interval:
+        if op is Add:
+            return Interval(_add(a.lo, b.lo), _add(a.hi, b.hi))
+        elif op is Sub:
+            return Interval(_add(a.lo, _neg(b.hi)), _add(a.hi, _neg(b.lo)))
+        elif op is Mult:
+            products = [_mul(x, y) for x in (a.lo, a.hi) for y in (b.lo, b.hi)]
+            return Interval(min(products), max(products))
+        elif op is Div:
+            if a.lo >= 0 and b.lo >= 1:
+                return Interval(0 if _isinf(b.hi) else a.lo // b.hi, a.hi if _isinf(a.hi) else a.hi // b.lo)
+            # |a // b| <= |a| for any b != 0
+            m = max(abs(a.lo), abs(a.hi))
+            return Interval(-m, m)
+        else:
+            # logical ops and comparisons
+            return Interval(0, 1)
+
+
+class CostModel:
+
+    @staticmethod
+    def linear(w):
+        return 2*(w+1)
+
+    def op_steps(self, v: Union[Value, int], widths: 'WidthFunction') -> Union[int, float]:
+        """ steps to compute v, including nested (non-atomized) operands """
+        if type(v) is int or type(v) is Var:
+            return 0
+        elif issubclass(type(v), UnaryOp):
+            return self.op_steps(v.a, widths) + self.linear(widths(v.a))
+        elif issubclass(type(v), BinaryOp):
+            wa, wb = widths(v.a), widths(v.b)
+            nested = self.op_steps(v.a, widths) + self.op_steps(v.b, widths)
+            if type(v) is Mult:
+                return nested + wa * 2*(wa+wb+1)
+            elif type(v) is Div:
+                return nested + wa * 4*(wa+1)
+            return nested + self.linear(max(wa, wb))
+        elif issubclass(type(v), AggregateOp):
+            # evaluated as a chain of binary ops on an accumulator
+            op = Add if type(v) is Sum else Mult
+            acc = Interval(0, 0) if type(v) is Sum else Interval(1, 1)
+            steps = 0
+            for k in v.a:
+                wa, wb = acc.width, widths(k)
+                steps += self.op_steps(k, widths)
+                steps += wa * 2*(wa+wb+1) if op is Mult else self.linear(max(wa, wb))
+                acc = IntervalEvaluator.binary(op, acc, widths.interval(k))
+            return steps
+        else:
+            raise NotImplementedError()
+
+    def tape_width(self, v: Union[Value, int], widths: 'WidthFunction') -> Union[int, float]:
+        """ widest tape read while computing v """
+        if type(v) is int or type(v) is Var:
+            return widths(v)
+        elif issubclass(type(v), UnaryOp):
+            return max(widths(v), self.tape_width(v.a, widths))
+        elif issubclass(type(v), BinaryOp):
+            return max(widths(v), self.tape_width(v.a, widths), self.tape_width(v.b, widths))
+        elif issubclass(type(v), AggregateOp):
+            return max([widths(v)] + [self.tape_width(k, widths) for k in v.a])
+        else:
+            raise NotImplementedError()
+
+
+class WidthFunction:
+
+    def __init__(self, evaluator: IntervalEvaluator, bounds: Dict[Var, Interval]):
+        self.evaluator = evaluator
+        self.bounds = bounds
+
+    def interval(self, v: Union[Value, int]) -> Interval:
+        return self.evaluator.run(v, self.bounds)
+
+    def __call__(self, v: Union[Value, int]) -> Union[int, float]:
+        return self.interval(v).width
+
+
+
+class InstructionCost:
+
+    def __init__(self, instruction: Instruction, depth: int):
+        self.instruction = instruction
+        self.depth = depth
+        self.steps = 0
+        self.peak_tape = 0
+        self.executions = 0
+        self.iterations = 0  # While only: most iterations of a single execution
+        self.assumed_trip_count = False  # While only: iterations is the given trip count, exiting wasn't proven
+
+    def __repr__(self):
+        line = repr(self.instruction).splitlines()[0]
+        loop = f' iterations={self.iterations}{" (assumed)" if self.assumed_trip_count else ""}' \
+            if type(self.instruction) is While else ''
+        return f'{"  "*self.depth}{line:<{40-2*self.depth}} steps={self.steps} peak_tape={self.peak_tape} ' \
+               f'executions={self.executions}{loop}'
+
+
+class CostEstimate:
+
+    def __init__(self, instructions: List[InstructionCost], bounds: Dict[Var, Interval],
+                 exit_bounds: Dict[Var, Interval], steps, peak_tape):
+        # instructions of nested bodies are included, steps of If/While instructions include their bodies
+        self.instructions = instructions
+        self.bounds = bounds  # range of each variable over the whole execution
+        self.exit_bounds = exit_bounds  # range of each variable after the program, the final values for a Profiler run
+        self.steps = steps
+        self.peak_tape = peak_tape
+
+    def __repr__(self):
+        return '\n'.join([repr(k) for k in self.instructions] +
+                         [f'total: steps={self.steps} peak_tape={self.peak_tape} '
+                          f'assumed_trip_count={self.assumed_trip_count}'])
+
+    @property
+    def assumed_trip_count(self) -> bool:
+        """ whether the estimate relies on the loops running at most loop_iterations times """
+        return any(k.assumed_trip_count for k in self.instructions)
+
+    @property
+    def tape_sizes(self) -> Dict[str, int]:
+        """ number of cells to preallocate per tape, see TuringMachine.run(tape_sizes=..) in tm_sim.py """
+        # unbounded tapes are left to grow on demand
+        return {v.name: b.width + 2 for v, b in self.bounds.items() if not _isinf(b.width)}
+
+
+class CostAnalyzer:
+    """ Static upper bound for the TM cost of a program
+
+    - input_widths: bit width of each input variable, i.e. 0 <= v < 2**w
+    - loop_iterations: upper bound on the trip count of every loop, the estimate is not sound for runs exceeding it
+    - max_width: values wider than this many bits are considered unbounded
+
+    """
+
+    def __init__(self, input_widths: Dict[Var, int], loop_iterations: int, max_width: Optional[int] = 512):
+        self.input_widths = input_widths
+        self.loop_iterations = loop_iterations
+        self.evaluator = IntervalEvaluator(max_width)
+        self.model = CostModel()
+        self.costs = {}
+        self.observed = {}
+
+    def run(self, program: Program) -> CostEstimate:
+        return self.estimate(program, {v: Interval.of_width(w) for v, w in self.input_widths.items()})
+
+    def estimate(self, program: Program, bounds: Dict[Var, Interval]) -> CostEstimate:
+        self.costs = {}
+        self.observed = dict(bounds)
+        exit_bounds, steps = self.analyze(program, bounds, depth=0, scale=1)
+        costs = list(self.costs.values())
+        return CostEstimate(costs, self.observed, exit_bounds, steps, max([k.peak_tape for k in costs], default=0))
+
+    def widths(self, bounds: Dict[Var, Interval]) -> WidthFunction:
+        return WidthFunction(self.evaluator, bounds)
+
+    def entry(self, instr: Instruction, depth: int) -> InstructionCost:
+        # created before nested bodies are analyzed to keep the program order
+        if id(instr) not in self.costs:
+            self.costs[id(instr)] = InstructionCost(instr, depth)
+        return self.costs[id(instr)]
+
+    @staticmethod
+    def record(c: InstructionCost, steps, peak_tape, scale):
+        c.steps = _add(c.steps, _mul(steps, scale))
+        c.peak_tape = max(c.peak_tape, peak_tape)
+        c.executions = _add(c.executions, scale)
+
+    def observe(self, v: Var, i: Interval):
+        self.observed[v] = self.observed[v].join(i) if v in self.observed else i
+
+    def analyze(self, program: Program, bounds: Dict[Var, Interval], depth: int, scale) \
+            -> Tuple[Dict[Var, Interval], Union[int, float]]:
+        """ returns the bounds after the program and the steps of a single execution of it """
+        steps = 0
+        for instr in program.p:
+            bounds, s = self.analyze_instruction(instr, bounds, depth, scale)
+            steps = _add(steps, s)
+        return bounds, steps
+
+    def analyze_instruction(self, instr: Instruction, bounds: Dict[Var, Interval], depth: int, scale) \
+            -> Tuple[Dict[Var, Interval], Union[int, float]]:
+        c = self.entry(instr, depth)
+        widths = self.widths(bounds)
+
+        if type(instr) in (Assign, Write, Copy):
+            target, value = (instr.variable, instr.value) if type(instr) is Assign else (instr.a, instr.b)
+            result = widths.interval(value)
+            steps = self.model.op_steps(value, widths)
+            if type(value) is int or type(value) is Var:
+                steps = self.model.linear(result.width)  # plain write / copy
+            self.record(c, steps, max(self.model.tape_width(value, widths), result.width) + 2, scale)
+            self.observe(target, result)
+            return {**bounds, target: result}, steps
+
+        elif type(instr) is If:
+            results = [self.analyze(body, bounds, depth+1, scale) for body in self.branches(instr, bounds)]
+            steps = _add(1 + self.model.op_steps(instr.condition, widths), max(s for _, s in results))
+            self.record(c, steps, self.model.tape_width(instr.condition, widths) + 2, scale)
+            after = results[0][0]
+            for b, _ in results[1:]:
+                after = self.join(after, b)
+            return after, steps
+
+        elif type(instr) is While:
+            return self.analyze_loop(instr, c, bounds, depth, scale)
+
+        else:
+            raise NotImplementedError()
+
+    def branches(self, instr: If, bounds: Dict[Var, Interval]) -> List[Program]:
+        condition = self.evaluator.run(instr.condition, bounds)
+        if condition == Interval.point(0):
+            return [instr.body_else]
+        elif 0 not in condition:
+            return [instr.body_if]
+        return [instr.body_if, instr.body_else]
+
+    def condition_steps(self, instr: While, bounds: Dict[Var, Interval]):
+        return 1 + self.model.op_steps(instr.condition, self.widths(bounds))
+
+    def analyze_loop(self, instr: While, c: InstructionCost, bounds: Dict[Var, Interval], depth: int, scale) \
+            -> Tuple[Dict[Var, Interval], Union[int, float]]:
+        # abstractly unrolls the loop, the bounds at the loop head grow monotonically until a fixpoint is reached.
+        # Bounds that grow by the same amount in two consecutive iterations (counters, accumulators) are extrapolated
+        # to the last iteration, the cost of which then bounds the cost of all remaining ones.
+        head = bounds
+        steps = 0
+        previous_delta = None
+        iterations = self.loop_iterations
+        for i in range(self.loop_iterations):
+            if self.evaluator.run(instr.condition, head) == Interval.point(0):
+                iterations = i
+                break
+            after, s = self.analyze(instr.body, head, depth+1, scale)
+            steps = _add(steps, _add(self.condition_steps(instr, head), s))
+            after = self.join(head, after)
+            remaining = self.loop_iterations - i - 1
+            if after == head:
+                # every remaining iteration costs as much as this one
+                if remaining:
+                    self.analyze(instr.body, head, depth+1, _mul(scale, remaining))
+                    steps = _add(steps, _mul(remaining, _add(self.condition_steps(instr, head), s)))
+                break
+            delta = self.delta(head, after)
+            if remaining and delta is not None and delta == previous_delta:
+                head = self.extrapolate(after, delta, remaining - 1)
+                after, s = self.analyze(instr.body, head, depth+1, _mul(scale, remaining))
+                steps = _add(steps, _mul(remaining, _add(self.condition_steps(instr, head), s)))
+                head = self.join(head, after)
+                break
+            previous_delta = delta
+            head = after
+        steps = _add(steps, self.condition_steps(instr, head))
+        self.record(c, steps, self.model.tape_width(instr.condition, self.widths(head)) + 2, scale)
+        c.iterations = max(c.iterations, iterations)
+        if self.evaluator.run(instr.condition, head) != Interval.point(0):
+            c.assumed_trip_count = True
+        return head, steps
+
+    @staticmethod
+    def join(a: Dict[Var, Interval], b: Dict[Var, Interval]) -> Dict[Var, Interval]:
+        # a variable that is only written on one path keeps the bounds of that path
+        return {v: a[v].join(b[v]) if v in a and v in b else (a[v] if v in a else b[v]) for v in {**a, **b}}
+
+    @staticmethod
+    def delta(a: Dict[Var, Interval], b: Dict[Var, Interval]) -> Optional[Dict[Var, Tuple[int, int]]]:
+        # per variable growth of the bounds from a to b, None if it can't be extrapolated
+        diff = lambda x, y: 0 if x == y else (None if _isinf(x) or _isinf(y) else y - x)
+        if set(v.name for v in a) != set(v.name for v in b):
+            return None
+        d = {v: (diff(a[v].lo, b[v].lo), diff(a[v].hi, b[v].hi)) for v in a}
+        return None if any(None in k for k in d.values()) else d
+
+    def extrapolate(self, bounds: Dict[Var, Interval], delta: Dict[Var, Tuple[int, int]], n: int) \
+            -> Dict[Var, Interval]:
+        return {v: self.evaluator.clamp(Interval(_add(i.lo, delta[v][0]*n), _add(i.hi, delta[v][1]*n)))
+                for v, i in bounds.items()}
+
+
+class Profiler(CostAnalyzer):
+    """ Cost of a concrete run under the same cost model, used to validate the estimates of CostAnalyzer """
+
+    def __init__(self):
+        # loops are run concretely, no trip count needed
+        super().__init__({}, loop_iterations=0, max_width=None)
+
+    def run(self, program: Program, variable_assignments: Dict[Var, int] = None) -> CostEstimate:
+        return self.estimate(program, {v: Interval.point(k) for v, k in (variable_assignments or {}).items()})
+
+    def truthy(self, condition: Union[Value, int], bounds: Dict[Var, Interval]) -> bool:
+        return bool(self.evaluator.run(condition, bounds).lo)
+
+    def branches(self, instr: If, bounds: Dict[Var, Interval]) -> List[Program]:
+        return [instr.body_if if self.truthy(instr.condition, bounds) else instr.body_else]
+
+    def analyze_loop(self, instr: While, c: InstructionCost, bounds: Dict[Var, Interval], depth: int, scale) \
+            -> Tuple[Dict[Var, Interval], Union[int, float]]:
+        steps = 0
+        iterations = 0
+        while self.truthy(instr.condition, bounds):
+            steps += self.condition_steps(instr, bounds)
+            bounds, s = self.analyze(instr.body, bounds, depth+1, scale)
+            steps += s
+            iterations += 1
+        steps += self.condition_steps(instr, bounds)
+        self.record(c, steps, self.model.tape_width(instr.condition, self.widths(bounds)) + 2, scale)
+        c.iterations = max(c.iterations, iterations)
+        return bounds, steps
+
+
+def validate(estimate: CostEstimate, profiles: List[CostEstimate]) -> List[str]:
+    """ Checks that the estimate bounds every profiled run (of the same program object), returns the violations """
+    violations = []
+    costs = {id(k.instruction): k for k in estimate.instructions}
+    for n, p in enumerate(profiles):
+        if p.steps > estimate.steps:
+            violations.append(f'run {n}: {p.steps} steps, estimated at most {estimate.steps}')
+        if p.peak_tape > estimate.peak_tape:
+            violations.append(f'run {n}: peak tape length {p.peak_tape}, estimated at most {estimate.peak_tape}')
+        for v, i in p.bounds.items():
+            if v not in estimate.bounds or not estimate.bounds[v].contains_interval(i):
+                violations.append(f'run {n}: {v} in {i}, estimated {estimate.bounds.get(v)}')
+        for k in p.instructions:
+            e = costs.get(id(k.instruction))
+            if e is None:
+                violations.append(f'run {n}: {k.instruction!r} was not analyzed')
+            elif k.steps > e.steps or k.peak_tape > e.peak_tape:
+                violations.append(f'run {n}: {k.instruction!r} took {k.steps} steps / {k.peak_tape} cells, '
+                                  f'estimated at most {e.steps} / {e.peak_tape}')
+            if e is not None and k.iterations > e.iterations:
+                violations.append(f'run {n}: loop {k.instruction.condition!r} ran {k.iterations} iterations, '
+                                  f'estimated at most {e.iterations}')
+    return violations
@@ -0,0 +1,188 @@
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+
+from compiler import Program, Var
+from corpus import (corpus, corpus_data, corpus_data_path, expected_failures, hand_written, random_inputs,
+                    random_corpus_programs, random_corpus_inputs, write_corpus)
+from cost_model import Profiler
+
+""" Differential fuzzing and benchmarking
+
+Every program is run on the same inputs through
+- Program.execute
+- Program.as_atomized.execute
+- the cost model's Profiler on the atomized program (stands in for the TM until programs can be compiled to one)
+
+and any difference in the final values of the program's variables (or in the raised exceptions) is reported.
+Throughput is reported as programs per second and modeled TM steps (see cost_model.py) per second.
+
+Atomization depends on PYTHONHASHSEED (Var hashes by name, RecursiveAtomizer picks temporaries with set.pop()), so the
+harness re-executes itself with a fixed hash seed, which the workers inherit. A run is reproduced by its RNG seed and
+hash seed.
+
+The corpus run additionally compares Program.execute with the results stored in corpus_data.py. Programs listed as
+expected failures there may diverge between the backends, a new divergence or a changed result fails the run.
+
+Usage:
+    python fuzz.py -n 1000              # fresh random programs
+    python fuzz.py --corpus             # regression benchmark over corpus.py
+    python fuzz.py --regenerate-corpus  # rewrites corpus_data.py from the current Program.create_random
+
+"""
+
+
+def run_backends(program: Program, variable_assignments: Dict[Var, int]) -> Tuple[Dict[str, object], int]:
+    """ final values (or the raised exception) per backend and the modeled TM steps """
+    names = {v.name for v in program.variables} | {v.name for v in variable_assignments}
+    atomized = program.as_atomized
+    results = {}
+    steps = 0
+
+    def run(backend, f):
+        try:
+            results[backend] = {v.name: int(k) for v, k in f().items() if v.name in names}
+        except Exception as e:
+            results[backend] = f'{type(e).__name__}: {e}'
+
+    def profile():
+        nonlocal steps
+        estimate = Profiler().run(atomized, variable_assignments)
+        steps = estimate.steps
+        return {v: i.lo for v, i in estimate.exit_bounds.items()}
+
+    run('execute', lambda: program.execute(dict(variable_assignments)))
+    run('atomized', lambda: atomized.execute(dict(variable_assignments)))
+    run('profiler', profile)
+    return results, steps
+
+
+def differential_run(name: str, program: Program, inputs: List[Dict[Var, int]],
+                     expected_results: Optional[List[object]] = None) -> Dict[str, object]:
+    """ divergences between the backends, and regressions of Program.execute against expected_results """
+    divergences = []
+    regressions = []
+    outputs = []
+    steps = 0
+    start = time.perf_counter()
+    for n, variable_assignments in enumerate(inputs):
+        results, s = run_backends(program, variable_assignments)
+        steps += s
+        expected = results['execute']
+        outputs.append(expected)
+        for backend, result in results.items():
+            if result != expected:
+                divergences.append(f'{name} {variable_assignments}: {backend} returned {result}, expected {expected}')
+        if expected_results is not None and expected != expected_results[n]:
+            regressions.append(f'{name} {variable_assignments}: execute returned {expected}, '
+                               f'corpus expects {expected_results[n]}')
+    return {'name': name, 'divergences': divergences, 'regressions': regressions, 'outputs': outputs,
+            'steps': steps, 'time': time.perf_counter() - start, 'program': program}
+
+
+def run_random_case(args: Tuple[int, int, int, int, int]) -> Dict[str, object]:
+    seed, size, max_depth, n_variables, n_inputs = args
+    program = Program.create_random(size=size, max_depth=max_depth, n_variables=n_variables, seed=seed)
+    return differential_run(f'seed={seed}', program, random_inputs(random.Random(seed), n_variables, n_inputs))
+
+
+def run_corpus_case(name: str) -> Dict[str, object]:
+    program, inputs, expected_results = corpus[name]
+    return differential_run(name, program, inputs, expected_results)
+
+
+def run_program_case(args: Tuple[str, Program, List[Dict[Var, int]]]) -> Dict[str, object]:
+    return differential_run(*args)
+
+
+def report(results: List[Dict[str, object]], elapsed: float, verbose: bool = False, xfail: set = frozenset()) -> int:
+    """ prints the failures and throughput, returns the number of unexpected failures """
+    failed = 0
+    for r in results:
+        if r['regressions'] or (r['divergences'] and r['name'] not in xfail):
+            failed += 1
+            print(f'FAILED {r["name"]}:')
+        elif r['divergences']:
+            print(f'expected failure {r["name"]}: {len(r["divergences"])} divergences')
+            continue
+        elif r['name'] in xfail:
+            print(f'unexpectedly passed {r["name"]}, regenerate the corpus to record it')
+            continue
+        else:
+            continue
+        if verbose:
+            print(r['program'])
+        for d in (r['regressions'] + r['divergences'])[:3]:
+            print('\t' + d)
+    steps = sum(r['steps'] for r in results)
+    print(f'{len(results)} programs, {failed} failed, {steps} modeled TM steps, {elapsed:.2f}s: '
+          f'{len(results) / elapsed:.1f} programs/s, {steps / elapsed:.0f} modeled TM steps/s')
+    return failed
+
+
+def regenerate_corpus(pool: ProcessPoolExecutor, hash_seed: int):
+    programs = random_corpus_programs()
+    inputs = random_corpus_inputs()
+    cases = [(name, p, i) for name, (p, i) in hand_written.items()] + [(k, programs[k], inputs[k]) for k in programs]
+    results = list(pool.map(run_program_case, cases))
+    write_corpus(corpus_data_path, programs, inputs, {r['name']: r['outputs'] for r in results},
+                 [r['name'] for r in results if r['divergences']], hash_seed)
+    print(f'wrote {len(results)} programs to {corpus_data_path}')
+
+
+def ensure_hash_seed(hash_seed: int, argv: List[str]):
+    """ re-executes the harness with PYTHONHASHSEED=hash_seed unless it already runs with it """
+    if os.environ.get('PYTHONHASHSEED') != str(hash_seed):
+        os.execve(sys.executable, [sys.executable, os.path.abspath(__file__)] + argv,
+                  {**os.environ, 'PYTHONHASHSEED': str(hash_seed)})
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', type=int, default=200, help='number of random programs')
+    parser.add_argument('--seed', type=int, default=None, help='seed of the first random program')
+    parser.add_argument('--size', type=int, default=10)
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--variables', type=int, default=3)
+    parser.add_argument('--inputs', type=int, default=8, help='input assignments per program')
+    parser.add_argument('--hash-seed', type=int, default=None,
+                        help='PYTHONHASHSEED to run the harness with, defaults to 0 (the corpus\'s own for --corpus)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--corpus', action='store_true', help='run the regression benchmark corpus instead')
+    parser.add_argument('--regenerate-corpus', action='store_true', help='rewrite corpus_data.py')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print diverging programs')
+    args = parser.parse_args(argv)
+    if args.corpus:
+        if corpus_data is None:
+            parser.error('no corpus_data.py, create it with --regenerate-corpus')
+        # the expected failures only hold for the hash seed they were recorded with
+        if args.hash_seed not in (None, corpus_data.hash_seed):
+            parser.error(f'the corpus was recorded with PYTHONHASHSEED={corpus_data.hash_seed}')
+        args.hash_seed = corpus_data.hash_seed
+    elif args.hash_seed is None:
+        args.hash_seed = 0
+    ensure_hash_seed(args.hash_seed, argv)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        if args.regenerate_corpus:
+            regenerate_corpus(pool, args.hash_seed)
+            return 0
+        elif args.corpus:
+            print(f'corpus, PYTHONHASHSEED={args.hash_seed}')
+            results = list(pool.map(run_corpus_case, corpus.keys()))
+        else:
+            first = args.seed if args.seed is not None else random.randrange(2**32)
+            print(f'seeds {first}..{first + args.n - 1}, PYTHONHASHSEED={args.hash_seed}')
+            cases = [(seed, args.size, args.depth, args.variables, args.inputs) for seed in range(first, first+args.n)]
+            results = list(pool.map(run_random_case, cases, chunksize=max(1, args.n // 64)))
+    return report(results, time.perf_counter() - start, args.verbose, expected_failures if args.corpus else set())
+
+
+if __name__ == '__main__':
+    sys.exit(1 if main() else 0)
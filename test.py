@@ -1,19 +1,6 @@
-from compiler import Var, Program, If, While
-
-a = Var('a')
-b = Var('b')
-c = Var('c')
-x = Var('x')
-y = Var('y')
-z = Var('z')
-
-mult = Program([
-    z <= 0,
-    While(x > 0, Program([
-        z <= z+y,
-        x <= x-1
-    ]))
-])
+from compiler import Program, Var, If, While
+from corpus import mult, fac, prime_checker, x, y, z
+from cost_model import CostAnalyzer, Profiler, validate
 
 print(mult)
 print('-'*30)
@@ -24,14 +11,6 @@ print(mult.as_atomized.execute({x: 5, y: 3}))
 print('\n'*3)
 
 
-fac = Program([
-    y <= 1,
-    While(x > 0, Program([
-        y <= y*x,
-        x <= x-1
-    ]))
-])
-
 print(fac)
 print('-'*30)
 print(fac.as_atomized)
@@ -41,19 +20,6 @@ print(fac.as_atomized.execute({x: 15}))
 print('\n'*3)
 
 
-prime_checker = Program([
-    z <= 1,
-    c <= 2,
-    While(c < x, Program([
-        b <= x // c,
-        If((b*c) == x, Program([
-            z <= 0
-        ]), Program([])),
-
-        c <= c+1
-    ]))
-])
-
 print(prime_checker)
 print('-'*30)
 print(prime_checker.as_atomized)
@@ -61,3 +27,69 @@ print('-'*30)
 print(prime_checker.execute({x: 3}))
 print(prime_checker.as_atomized.execute({x: 3}))
 print('\n'*3)
+
+
+for prog, input_widths, loop_iterations, samples in [
+    (mult, {x: 4, y: 4}, 15, [{x: i, y: j} for i in range(16) for j in range(16)]),
+    (fac, {x: 4}, 15, [{x: i} for i in range(16)]),
+    (prime_checker, {x: 5}, 29, [{x: i} for i in range(32)]),
+]:
+    atomized = prog.as_atomized
+    estimate = CostAnalyzer(input_widths, loop_iterations).run(atomized)
+    profiles = [Profiler().run(atomized, s) for s in samples]
+    print(estimate)
+    print('tape sizes:', estimate.tape_sizes)
+    print('max profiled steps:', max(p.steps for p in profiles), 'peak tape:', max(p.peak_tape for p in profiles))
+    print('violations:', validate(estimate, profiles))
+    assert not validate(estimate, profiles)
+    print('\n'*3)
+
+# values beyond float range (z has 14685 bits here) must not overflow the cost model
+squaring = Program([
+    z <= x,
+    While(x > 0, Program([
+        z <= z*z,
+        x <= x-1
+    ]))
+])
+assert Profiler().run(squaring.as_atomized, {x: 12}).exit_bounds[z].lo == squaring.execute({x: 12})[z]
+
+# loop conditions of atomized programs can't be proven false, the estimate relies on the given trip count
+countdown = Program([
+    z <= x*y,
+    While(z > 0, Program([
+        z <= z-1
+    ]))
+]).as_atomized
+profiles = [Profiler().run(countdown, {x: i, y: j}) for i in range(16) for j in range(16)]
+estimate = CostAnalyzer({x: 4, y: 4}, loop_iterations=225).run(countdown)
+assert estimate.assumed_trip_count and not validate(estimate, profiles)
+estimate = CostAnalyzer({x: 4, y: 4}, loop_iterations=16).run(countdown)
+assert any('ran 225 iterations, estimated at most 16' in v for v in validate(estimate, profiles))
+
+
+def instruction_count(p: Program) -> int:
+    # without the loop counters i0, i1, .. that create_random adds
+    count = 0
+    for k in p.p:
+        if type(k) is If:
+            count += 1 + instruction_count(k.body_if) + instruction_count(k.body_else)
+        elif type(k) is While:
+            count += 1 + instruction_count(k.body)
+        elif not k.variables[0].name.startswith('i'):
+            count += 1
+    return count
+
+def nesting_depth(p: Program) -> int:
+    return max([1 + max(nesting_depth(k.body_if), nesting_depth(k.body_else)) if type(k) is If else
+                1 + nesting_depth(k.body) if type(k) is While else 0 for k in p.p], default=0)
+
+for seed in range(100):
+    size, max_depth = seed % 20 + 1, seed % 4
+    random_program = Program.create_random(size=size, max_depth=max_depth, seed=seed)
+    assert repr(random_program) == repr(Program.create_random(size=size, max_depth=max_depth, seed=seed))
+    assert instruction_count(random_program) == size and nesting_depth(random_program) <= max_depth
+    random_program.execute({Var('v0'): seed, Var('v1'): -seed, Var('v2'): 7})  # terminates
+
+assert repr(Program.create_random(seed=0)) != repr(Program.create_random(seed=1))
+Program.create_random(max_expression_depth=0, seed=0).execute({Var('v0'): 1, Var('v1'): 2, Var('v2'): 3})
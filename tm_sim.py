@@ -17,10 +17,13 @@ class TuringMachine:
         assert self.initial_state in self.states
         assert all(q[0] in states for q in transitions.keys()) and all(q[0] in states for q in transitions.values())
 
-    def run(self, initial_tape_contents=None, debugger=False):
+    def run(self, initial_tape_contents=None, debugger=False, tape_sizes=None):
+        # tape_sizes: number of cells to preallocate per tape, e.g. CostEstimate.tape_sizes from cost_model.py
         if initial_tape_contents is None:
             initial_tape_contents = {}
-        self.tapes = [Tape(n, initial_tape_contents[n]) if n in initial_tape_contents else Tape(n) for n in self.tape_names]
+        if tape_sizes is None:
+            tape_sizes = {}
+        self.tapes = [Tape(n, initial_tape_contents.get(n), tape_sizes.get(n)) for n in self.tape_names]
         self.current_state = self.initial_state
 
         for step in itertools.count():
@@ -42,9 +45,11 @@ class TuringMachine:
                 return
 
 class Tape:
-    def __init__(self, name: str, initial_tape_contents: int = None):
+    def __init__(self, name: str, initial_tape_contents: int = None, size: int = None):
         self.name = name
         self.value = deque([-1]) if initial_tape_contents is None else deque([int(c) for c in bin(initial_tape_contents)[2:][::-1]])
+        if size is not None:
+            self.value.extend([-1] * (size - len(self.value)))
         self.pointer = 0
 
     def read(self):
@@ -89,5 +94,7 @@ tm_transitions = {
     ('0', -1, 1): ('1', [-1, -1], [1, 1]),
     ('0', -1, -1): ('1', [-1, -1], [1, 1]),
 }
-tm = TuringMachine(transitions=tm_transitions, initial_state='q', states=['0', '1'], tapes=['a', 'b'])
-tm.run(initial_tape_contents={'a': 15}, debugger=True)
\ No newline at end of file
+
+if __name__ == '__main__':
+    tm = TuringMachine(transitions=tm_transitions, initial_state='0', states=['0', '1'], tapes=['a', 'b'])
+    tm.run(initial_tape_contents={'a': 15}, debugger=True)
\ No newline at end of file